@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Async Image Loader
+Decodes images on the global thread pool so the GUI thread never waits on them
+"""
+
+from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool, Qt
+from PyQt5.QtGui import QImage, QImageReader
+
+# Signal objects of loads still running; kept alive until their result arrives
+_pending = set()
+
+
+class _LoaderSignals(QObject):
+    """Signals for _LoadTask; QRunnable itself cannot emit"""
+    loaded = pyqtSignal(str, object)  # file_path, QImage (null on failure)
+
+
+class _LoadTask(QRunnable):
+    """Decode one image, scaled to fit a square, on a pool thread"""
+    
+    def __init__(self, file_path: str, size: int):
+        super().__init__()
+        self.file_path = file_path
+        self.size = size
+        self.signals = _LoaderSignals()
+    
+    def run(self):
+        """Decode the image and post it back to the thread that asked for it"""
+        self.signals.loaded.emit(self.file_path, read_scaled_image(self.file_path, self.size))
+
+
+def read_scaled_image(file_path: str, size: int, enlarge: bool = False) -> QImage:
+    """Decode an image to fit within size x size, upright
+    
+    Smaller images keep their size unless enlarge is set. Only touches
+    QImage, so it is safe to call off the GUI thread; returns a null QImage
+    if the file can't be read.
+    """
+    # Let the decoder produce the target size directly (JPEG uses DCT scaling)
+    # instead of decoding full size and scaling after
+    reader = QImageReader(file_path)
+    reader.setAutoTransform(True)  # Apply EXIF orientation
+    source_size = reader.size()
+    if source_size.isValid() and (enlarge or source_size.width() > size
+                                  or source_size.height() > size):
+        reader.setScaledSize(source_size.scaled(size, size, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+def load_async(file_path: str, size: int, callback):
+    """Decode an image on the global thread pool
+    
+    callback(file_path, image) runs on the calling thread once the image is
+    ready; image is a null QImage if it could not be read. QPixmap may only
+    be created on the GUI thread, so callers convert the QImage themselves.
+    """
+    task = _LoadTask(file_path, size)
+    signals = task.signals
+    _pending.add(signals)
+    signals.loaded.connect(callback)
+    signals.loaded.connect(lambda *_: _pending.discard(signals))
+    QThreadPool.globalInstance().start(task)
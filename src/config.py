@@ -7,6 +7,7 @@ Handles application settings with persistence
 
 import os
 import json
+from contextlib import contextmanager
 from PyQt5.QtCore import QSettings, QStandardPaths
 
 
@@ -15,6 +16,8 @@ class Config:
     
     def __init__(self):
         self.settings = QSettings("PhotoViewer", "ModernPhotoViewer")
+        self._int_cache = {}
+        self._batch_depth = 0
         self._load_defaults()
     
     def _load_defaults(self):
@@ -36,6 +39,9 @@ class Config:
             'theme': 'dark',
             'auto_scan': True,
             'cache_thumbnails': True,
+            'use_process_pool': False,  # Parse EXIF in worker processes while scanning
+            'scan_threads': 4,  # Concurrent directory listings (raise for network shares)
+            'native_file_dialogs': True,  # Qt's own dialog stats every entry on slow mounts
             'max_cache_size': 20000,  # Increased to 20GB (20000 MB) as requested
             'max_thumbnails': 200   # Increased maximum number of active thumbnails
         }
@@ -49,7 +55,48 @@ class Config:
     def set(self, key, value):
         """Set configuration value"""
         self.settings.setValue(key, value)
-        self.settings.sync()
+        if not self._batch_depth:
+            self.settings.sync()
+        self._int_cache.pop(key, None)
+    
+    @contextmanager
+    def batch(self):
+        """Group several set() calls into a single write to disk"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.settings.sync()
+    
+    def get_int(self, key, default):
+        """Get an integer value, coercing settings stored as strings once"""
+        if key not in self._int_cache:
+            try:
+                self._int_cache[key] = int(self.get(key, default))
+            except (ValueError, TypeError):
+                self._int_cache[key] = default
+        return self._int_cache[key]
+    
+    def _get_bool(self, key, default):
+        """Get a boolean value, handling settings stored as strings"""
+        value = self.get(key, default)
+        if isinstance(value, str):
+            return value.lower() == 'true'
+        return bool(value)
+    
+    def snapshot(self):
+        """Get the user-editable settings as a plain dict, read in one pass"""
+        return {
+            'photo_path': self.get_photo_path(),
+            'auto_scan': self.is_auto_scan_enabled(),
+            'show_hidden_files': self._get_bool('show_hidden_files', False),
+            'theme': self.get_theme(),
+            'thumbnail_size': self.get_thumbnail_size(),
+            'cache_thumbnails': self.is_cache_enabled(),
+            'max_cache_size': self.get_int('max_cache_size', self.defaults['max_cache_size']),
+        }
     
     def get_photo_path(self):
         """Get configured photo path"""
@@ -76,11 +123,7 @@ class Config:
     
     def get_thumbnail_size(self):
         """Get thumbnail size"""
-        size = self.get('thumbnail_size', 200)
-        try:
-            return int(size)
-        except (ValueError, TypeError):
-            return 200
+        return self.get_int('thumbnail_size', 200)
     
     def set_thumbnail_size(self, size):
         """Set thumbnail size"""
@@ -112,24 +155,24 @@ class Config:
     
     def is_cache_enabled(self):
         """Check if thumbnail caching is enabled"""
-        value = self.get('cache_thumbnails', True)
-        # Ensure we return a boolean value
-        if isinstance(value, str):
-            return value.lower() == 'true'
-        return bool(value)
+        return self._get_bool('cache_thumbnails', True)
     
     def is_auto_scan_enabled(self):
         """Check if auto scan is enabled"""
-        value = self.get('auto_scan', True)
-        # Ensure we return a boolean value
-        if isinstance(value, str):
-            return value.lower() == 'true'
-        return bool(value)
+        return self._get_bool('auto_scan', True)
     
     def set_auto_scan(self, enabled):
         """Set auto scan preference"""
         self.set('auto_scan', enabled)
     
+    def is_process_pool_enabled(self):
+        """Check if scanning should extract metadata in worker processes"""
+        return self._get_bool('use_process_pool', False)
+    
+    def use_native_file_dialogs(self):
+        """Check if the platform's native file dialogs should be used"""
+        return self._get_bool('native_file_dialogs', True)
+    
     def get_cache_dir(self):
         """Get cache directory path"""
         cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
@@ -139,13 +182,14 @@ class Config:
     
     def get_max_thumbnails(self):
         """Get maximum number of active thumbnails"""
-        max_thumbnails = self.get('max_thumbnails', 200)  # Increased default
-        try:
-            return int(max_thumbnails)
-        except (ValueError, TypeError):
-            return 200
+        return self.get_int('max_thumbnails', 200)  # Increased default
+    
+    def get_scan_threads(self):
+        """Get number of threads listing directories while scanning"""
+        return max(1, self.get_int('scan_threads', 4))
     
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
         self.settings.clear()
-        self.settings.sync()
\ No newline at end of file
+        self.settings.sync()
+        self._int_cache.clear()
\ No newline at end of file
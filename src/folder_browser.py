@@ -195,7 +195,7 @@ class FolderBrowserWidget(QWidget):
         # Title with icon
         title_layout = QHBoxLayout()
         title_label = QLabel("📁 按文件夹浏览")
-        title_label.setProperty("labelStyle", "heading")
+        title_label.setObjectName("headingLabel")
         title_layout.addWidget(title_label)
         
         header_layout.addLayout(title_layout)
@@ -203,7 +203,7 @@ class FolderBrowserWidget(QWidget):
         
         # Breadcrumb with better styling
         self.breadcrumb_label = QLabel("")
-        self.breadcrumb_label.setProperty("labelStyle", "breadcrumb")
+        self.breadcrumb_label.setObjectName("breadcrumbLabel")
         self.breadcrumb_label.setWordWrap(True)
         self.breadcrumb_label.setMaximumWidth(400)
         header_layout.addWidget(self.breadcrumb_label)
@@ -225,12 +225,12 @@ class FolderBrowserWidget(QWidget):
         # Tree header with stats
         tree_header_layout = QHBoxLayout()
         tree_header = QLabel("📂 文件夹")
-        tree_header.setProperty("labelStyle", "subheading")
+        tree_header.setObjectName("subheadingLabel")
         tree_header_layout.addWidget(tree_header)
         
         # Stats label
         self.folder_stats_label = QLabel("")
-        self.folder_stats_label.setProperty("labelStyle", "caption")
+        self.folder_stats_label.setObjectName("captionLabel")
         tree_header_layout.addStretch()
         tree_header_layout.addWidget(self.folder_stats_label)
         
@@ -256,14 +256,14 @@ class FolderBrowserWidget(QWidget):
         gallery_header_layout = QHBoxLayout()
         
         self.gallery_header = QLabel("🖼️ 选择文件夹查看照片")
-        self.gallery_header.setProperty("labelStyle", "subheading")
+        self.gallery_header.setObjectName("subheadingLabel")
         gallery_header_layout.addWidget(self.gallery_header)
         
         gallery_header_layout.addStretch()
         
         # View options
         self.view_mode_label = QLabel("查看模式：")
-        self.view_mode_label.setProperty("labelStyle", "caption")
+        self.view_mode_label.setObjectName("captionLabel")
         gallery_header_layout.addWidget(self.view_mode_label)
         
         right_layout.addLayout(gallery_header_layout)
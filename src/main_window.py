@@ -39,7 +39,7 @@ class ScanProgressWidget(QWidget):
         
         # Progress info
         self.status_label = QLabel("准备扫描...")
-        self.status_label.setProperty("labelStyle", "subheading")
+        self.status_label.setObjectName("subheadingLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.status_label)
         
@@ -52,13 +52,13 @@ class ScanProgressWidget(QWidget):
         
         # Details
         self.details_label = QLabel("")
-        self.details_label.setProperty("labelStyle", "caption")
+        self.details_label.setObjectName("captionLabel")
         self.details_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.details_label)
         
         # Cancel button
         self.cancel_button = QPushButton("取消")
-        self.cancel_button.setProperty("buttonStyle", "secondary")
+        self.cancel_button.setObjectName("secondaryButton")
         layout.addWidget(self.cancel_button)
     
     def update_progress(self, current: int, total: int, status: str = ""):
@@ -81,6 +81,12 @@ class MainWindow(QMainWindow):
         self.photo_database = PhotoDatabase()
         self.photo_scanner = None
         self.thumbnail_generator = None
+        self.settings_window = None
+        
+        # Scan progress is polled instead of signalled for every file
+        self.scan_progress_timer = QTimer(self)
+        self.scan_progress_timer.setInterval(100)
+        self.scan_progress_timer.timeout.connect(self.poll_scan_progress)
         
         self.setup_ui()
         self.setup_menu_bar()
@@ -199,7 +205,7 @@ class MainWindow(QMainWindow):
         
         # Photo count label
         self.photo_count_label = QLabel("0 张照片")
-        self.photo_count_label.setProperty("labelStyle", "caption")
+        self.photo_count_label.setObjectName("captionLabel")
         toolbar.addWidget(self.photo_count_label)
         
         # Add stretch to push items to the right
@@ -235,11 +241,12 @@ class MainWindow(QMainWindow):
     def setup_scanner(self):
         """Setup photo scanner"""
         self.photo_scanner = PhotoScanner(self.config)
-        self.photo_scanner.photo_found.connect(self.on_photo_found)
-        self.photo_scanner.progress_updated.connect(self.on_scan_progress)
+        self.photo_scanner.photos_batch_found.connect(self.on_photos_found, Qt.QueuedConnection)
         self.photo_scanner.scanning_started.connect(self.on_scanning_started)
         self.photo_scanner.scanning_finished.connect(self.on_scanning_finished)
         self.photo_scanner.error_occurred.connect(self.on_scan_error)
+        # A scan that dies with an error never emits scanning_finished
+        self.photo_scanner.finished.connect(self.scan_progress_timer.stop)
     
     def handle_startup(self):
         """Handle application startup"""
@@ -335,9 +342,15 @@ class MainWindow(QMainWindow):
         self.scan_button.setEnabled(True)
         self.scan_action.setEnabled(True)
     
-    def on_photo_found(self, photo_info: PhotoInfo):
-        """Handle photo found during scanning"""
-        self.photo_database.add_photo(photo_info)
+    def on_photos_found(self, photos: List[PhotoInfo]):
+        """Handle a batch of photos found during scanning"""
+        self.photo_database.add_photos(photos)
+    
+    def poll_scan_progress(self):
+        """Read the scanner's progress counters and update the display"""
+        if self.photo_scanner:
+            current, total = self.photo_scanner.get_progress()
+            self.on_scan_progress(current, total)
     
     def on_scan_progress(self, current: int, total: int):
         """Handle scan progress update"""
@@ -350,10 +363,12 @@ class MainWindow(QMainWindow):
     
     def on_scanning_started(self, folder_path: str):
         """Handle scanning started"""
+        self.scan_progress_timer.start()
         self.update_status(f"正在扫描： {folder_path}")
     
     def on_scanning_finished(self, photo_count: int):
         """Handle scanning completion"""
+        self.scan_progress_timer.stop()
         self.hide_scanning_progress()
         self.operation_progress.setVisible(False)
         
@@ -376,6 +391,7 @@ class MainWindow(QMainWindow):
         
         # If it's a critical error, stop scanning
         if "路径不存在" in error_msg:
+            self.scan_progress_timer.stop()
             self.hide_scanning_progress()
             QMessageBox.critical(self, "扫描错误", error_msg)
     
@@ -405,10 +421,14 @@ class MainWindow(QMainWindow):
     
     def show_settings(self):
         """Show settings window"""
-        settings_window = SettingsWindow(self.config, self)
-        settings_window.settings_applied.connect(self.on_settings_applied)
-        settings_window.photo_path_changed.connect(self.on_photo_path_changed)
-        settings_window.exec_()
+        # Build the dialog once and reuse it; later opens only reload values
+        if self.settings_window is None:
+            self.settings_window = SettingsWindow(self.config, self)
+            self.settings_window.settings_applied.connect(self.on_settings_applied)
+            self.settings_window.photo_path_changed.connect(self.on_photo_path_changed)
+        else:
+            self.settings_window.reload_settings()
+        self.settings_window.exec_()
     
     def on_settings_applied(self):
         """Handle settings changes"""
@@ -18,6 +18,7 @@ from PyQt5.QtCore import Qt, pyqtSignal, QFileInfo, QUrl
 from PyQt5.QtGui import QPixmap, QFont, QDesktopServices, QColor
 
 from .photo_scanner import PhotoInfo
+from .async_image_loader import load_async
 
 
 class PhotoDetailsDialog(QDialog):
@@ -113,7 +114,7 @@ class PhotoDetailsDialog(QDialog):
         
         for i, (label_text, value_text) in enumerate(info_items):
             label = QLabel(label_text)
-            label.setProperty("labelStyle", "caption")
+            label.setObjectName("captionLabel")
             label.setMinimumWidth(100)
             
             value = QLabel(str(value_text))
@@ -190,7 +191,7 @@ class PhotoDetailsDialog(QDialog):
             # No metadata available
             no_data_label = QLabel("此文件没有可用的元数据。")
             no_data_label.setAlignment(Qt.AlignCenter)
-            no_data_label.setProperty("labelStyle", "caption")
+            no_data_label.setObjectName("captionLabel")
             layout.addWidget(no_data_label)
         
         self.tab_widget.addTab(tab, "元数据")
@@ -203,7 +204,7 @@ class PhotoDetailsDialog(QDialog):
         
         # File path section
         path_label = QLabel("完整路径:")
-        path_label.setProperty("labelStyle", "caption")
+        path_label.setObjectName("captionLabel")
         layout.addWidget(path_label)
         
         path_text = QTextEdit()
@@ -235,7 +236,7 @@ class PhotoDetailsDialog(QDialog):
         
         for i, (label_text, value_text) in enumerate(additional_items):
             label = QLabel(label_text)
-            label.setProperty("labelStyle", "caption")
+            label.setObjectName("captionLabel")
             label.setMinimumWidth(100)
             
             value = QLabel(str(value_text))
@@ -256,20 +257,20 @@ class PhotoDetailsDialog(QDialog):
                 self.preview_label.setText("文件不存在")
                 return
                 
-            pixmap = QPixmap(self.photo_info.file_path)
-            if not pixmap.isNull():
-                # Scale to fit preview maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    180, 180,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.preview_label.setPixmap(scaled_pixmap)
-            else:
-                self.preview_label.setText("预览\n不可用")
+            # Decode off the GUI thread so the dialog opens without waiting
+            # on a full-resolution photo
+            self.preview_label.setText("加载中...")
+            load_async(self.photo_info.file_path, 180, self.on_preview_loaded)
         except Exception as e:
             self.preview_label.setText(f"预览错误:\n{str(e)[:30]}")
     
+    def on_preview_loaded(self, file_path: str, image):
+        """Show a preview decoded by the async loader"""
+        if not image.isNull():
+            self.preview_label.setPixmap(QPixmap.fromImage(image))
+        else:
+            self.preview_label.setText("预览\n不可用")
+    
     def load_photo_data(self):
         """Load photo data into the dialog"""
         # This method can be extended to load additional data
@@ -363,12 +363,12 @@ class VirtualScrollGallery(QScrollArea):
         empty_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         empty_label = QLabel("未找到照片")
-        empty_label.setProperty("labelStyle", "heading")
+        empty_label.setObjectName("headingLabel")
         empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_layout.addWidget(empty_label)
         
         desc_label = QLabel("在配置的目录中添加照片或在设置中更改照片路径。")
-        desc_label.setProperty("labelStyle", "caption")
+        desc_label.setObjectName("captionLabel")
         desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         desc_label.setWordWrap(True)
         empty_layout.addWidget(desc_label)
@@ -569,19 +569,19 @@ class PhotoGalleryWidget(QWidget):
         controls_layout.setContentsMargins(16, 8, 16, 8)
         
         self.photo_count_label = QLabel("0 张照片")
-        self.photo_count_label.setProperty("labelStyle", "caption")
+        self.photo_count_label.setObjectName("captionLabel")
         controls_layout.addWidget(self.photo_count_label)
         
         controls_layout.addStretch()
         
         # Selection controls
         self.select_all_btn = QPushButton("全选")
-        self.select_all_btn.setProperty("buttonStyle", "secondary")
+        self.select_all_btn.setObjectName("secondaryButton")
         self.select_all_btn.clicked.connect(self.select_all_photos)
         controls_layout.addWidget(self.select_all_btn)
         
         self.clear_selection_btn = QPushButton("清除选择")
-        self.clear_selection_btn.setProperty("buttonStyle", "secondary")
+        self.clear_selection_btn.setObjectName("secondaryButton")
         self.clear_selection_btn.clicked.connect(self.clear_selection)
         controls_layout.addWidget(self.clear_selection_btn)
         
@@ -7,9 +7,15 @@ Optimized for handling thousands of photos efficiently
 """
 
 import os
+import re
 import time
 import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                wait, FIRST_COMPLETED)
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from PyQt5.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
@@ -18,14 +24,29 @@ from PIL import Image, ExifTags
 from PIL.ExifTags import TAGS
 
 
+# EXIF tags kept on PhotoInfo; MakerNote, thumbnails and other blobs are dropped
+_WANTED_EXIF_TAGS = frozenset({
+    0x010F,  # Make
+    0x0110,  # Model
+    0x0132,  # DateTime
+    0x829A,  # ExposureTime
+    0x829D,  # FNumber
+    0x8827,  # ISOSpeedRatings
+    0x9003,  # DateTimeOriginal
+})
+
+# Read size when hashing whole files; large reads amortise the syscall cost
+_HASH_CHUNK_SIZE = 128 * 1024
+
+
 @dataclass
 class PhotoInfo:
     """Photo information data class"""
     file_path: str
     file_name: str
     file_size: int
-    creation_time: datetime
-    modification_time: datetime
+    creation_timestamp: float
+    modification_timestamp: float
     width: int
     height: int
     format: str
@@ -33,26 +54,198 @@ class PhotoInfo:
     thumbnail_path: Optional[str] = None
     exif_data: Optional[Dict] = None
     file_hash: Optional[str] = None
+    
+    @property
+    def creation_time(self) -> datetime:
+        """Creation time, materialized on demand from the raw timestamp"""
+        return datetime.fromtimestamp(self.creation_timestamp)
+    
+    @property
+    def modification_time(self) -> datetime:
+        """Modification time, materialized on demand from the raw timestamp"""
+        return datetime.fromtimestamp(self.modification_timestamp)
+
+
+def _parse_exif_datetime(value) -> Optional[float]:
+    """Parse an EXIF 'YYYY:MM:DD HH:MM:SS' string into a timestamp"""
+    try:
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:16]), int(value[17:19])).timestamp()
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _hash_file(file_path: str, limit: Optional[int] = None) -> str:
+    """Generate MD5 hash of a file, optionally of only its first `limit` bytes"""
+    try:
+        hash_md5 = hashlib.md5()
+        remaining = limit
+        # One buffer per file, refilled in place instead of a new bytes per read
+        buffer = memoryview(bytearray(_HASH_CHUNK_SIZE if limit is None
+                                      else min(_HASH_CHUNK_SIZE, limit)))
+        # Unbuffered: every read is at least a chunk, so a buffer only adds a copy
+        with open(file_path, "rb", buffering=0) as f:
+            # Whole-file reads: ask for aggressive readahead, then drop the
+            # pages so hashing doesn't evict thumbnails from the page cache
+            advise = limit is None and hasattr(os, 'posix_fadvise')
+            if advise:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            
+            # Read in chunks for large files
+            while remaining is None or remaining > 0:
+                read = f.readinto(buffer if remaining is None or remaining >= len(buffer)
+                                  else buffer[:remaining])
+                if not read:
+                    break
+                hash_md5.update(buffer[:read])
+                if remaining is not None:
+                    remaining -= read
+            
+            if advise:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        return hash_md5.hexdigest()
+    except Exception:
+        return ""
+
+
+def _read_photo_fields(file_path: str) -> Optional[Dict]:
+    """Read file stats, dimensions and EXIF as PhotoInfo keyword arguments"""
+    # One descriptor serves both the stat and the PIL header/EXIF read
+    try:
+        photo_file = open(file_path, 'rb')
+    except FileNotFoundError:
+        return None
+    
+    with photo_file:
+        # Basic file info
+        stat = os.fstat(photo_file.fileno())
+        file_name = os.path.basename(file_path)
+        file_size = stat.st_size
+        modification_timestamp = stat.st_mtime
+        creation_timestamp = stat.st_ctime
+        folder_path = os.path.dirname(file_path)
+        
+        # File format
+        _, ext = os.path.splitext(file_path.lower())
+        format_name = ext[1:].upper() if ext else "UNKNOWN"
+        
+        # Initialize dimensions
+        width, height = 0, 0
+        exif_data = None
+        
+        # Try to get image info and EXIF data
+        try:
+            with Image.open(photo_file) as img:
+                width, height = img.size
+                
+                # Extract EXIF data
+                exif = img._getexif() if hasattr(img, '_getexif') else None
+                if exif is not None:
+                    exif_dict = {}
+                    
+                    for tag_id, value in exif.items():
+                        if tag_id in _WANTED_EXIF_TAGS:
+                            exif_dict[TAGS.get(tag_id, tag_id)] = value
+                    
+                    exif_data = exif_dict
+                    
+                    # Try to get better creation time from EXIF
+                    if 'DateTime' in exif_data:
+                        exif_time = _parse_exif_datetime(exif_data['DateTime'])
+                    else:
+                        exif_time = _parse_exif_datetime(exif_data.get('DateTimeOriginal'))
+                    if exif_time is not None:
+                        creation_timestamp = exif_time
+                            
+        except Exception:
+            # If image processing fails, it might be a video or corrupted file
+            # For videos, we'll handle them differently
+            pass
+    
+    return {
+        'file_path': file_path,
+        'file_name': file_name,
+        'file_size': file_size,
+        'creation_timestamp': creation_timestamp,
+        'modification_timestamp': modification_timestamp,
+        'width': width,
+        'height': height,
+        'format': format_name,
+        'folder_path': folder_path,
+        'exif_data': exif_data,
+    }
+
+
+def _list_directory(path: str, ext_match) -> Tuple[str, List[str], List[str]]:
+    """List one directory, returning its visible subdirectories and media file names"""
+    subdirs, files = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if is_dir:
+                    # Skip hidden directories and, like os.walk, don't follow links
+                    if not entry.name.startswith('.') and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif ext_match(entry.name) is not None:
+                    files.append(entry.name)
+    except OSError:
+        pass
+    return path, subdirs, files
+
+
+def _extract_photo_info_batch(file_paths: List[str]) -> List[Tuple[str, Optional[Dict], Optional[str]]]:
+    """Process pool entry point: read a batch of files, returning plain dicts"""
+    results = []
+    for file_path in file_paths:
+        try:
+            results.append((file_path, _read_photo_fields(file_path), None))
+        except Exception as e:
+            results.append((file_path, None, str(e)))
+    return results
 
 
 class PhotoScanner(QThread):
     """High-performance photo scanner with metadata extraction"""
     
     # Signals
-    photo_found = pyqtSignal(PhotoInfo)
-    progress_updated = pyqtSignal(int, int)  # current, total
+    photos_batch_found = pyqtSignal(list)  # list of PhotoInfo
     scanning_started = pyqtSignal(str)  # folder path
     scanning_finished = pyqtSignal(int)  # total photos found
     error_occurred = pyqtSignal(str, str)  # error message, file path
     
+    # Files submitted per process pool task
+    PROCESS_BATCH_SIZE = 256
+    # Photos delivered per photos_batch_found emission
+    PHOTO_BATCH_SIZE = 200
+    
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
-        self.mutex = QMutex()
-        self.should_stop = False
+        # Set once to cancel; Event.is_set() is a cheap lock-free read per file
+        self._stop_event = threading.Event()
         self.current_folder = ""
         self.photos_found = 0
+        # Progress is polled by the UI rather than signalled per file
+        self.processed_files = 0
         self.total_files = 0
+        self._found_batch: List[PhotoInfo] = []
+        self._ext_re = self._build_extension_matcher()
+        
+    def _build_extension_matcher(self):
+        """Compile supported image/video extensions into a single regex search"""
+        extensions = set()
+        for ext in list(self.config.get_supported_formats()) + list(self.config.get_video_formats()):
+            ext = ext.lower().lstrip('.')
+            if ext:
+                extensions.add(re.escape(ext))
+        # Longest first so alternation never stops on a shorter prefix
+        pattern = '|'.join(sorted(extensions, key=len, reverse=True))
+        return re.compile(rf'(?i)\.(?:{pattern})$').search
         
     def scan_photos(self, root_path: str):
         """Start scanning photos in given path"""
@@ -61,219 +254,219 @@ class PhotoScanner(QThread):
             return
             
         self.root_path = root_path
-        self.should_stop = False
+        self._stop_event.clear()
         self.photos_found = 0
+        self.processed_files = 0
+        self.total_files = 0
+        self._found_batch = []
         self.start()
     
     def stop_scanning(self):
         """Stop the scanning process"""
-        with QMutexLocker(self.mutex):
-            self.should_stop = True
+        self._stop_event.set()
+    
+    def get_progress(self) -> Tuple[int, int]:
+        """Get (processed, total) file counts for the running scan"""
+        return self.processed_files, self.total_files
+    
+    def _add_found_photo(self, photo_info: PhotoInfo):
+        """Queue a found photo, emitting a batch once enough have accumulated"""
+        self._found_batch.append(photo_info)
+        self.photos_found += 1
+        if len(self._found_batch) >= self.PHOTO_BATCH_SIZE:
+            self._flush_found_photos()
+    
+    def _flush_found_photos(self):
+        """Emit any queued photos as a single batch"""
+        if self._found_batch:
+            batch, self._found_batch = self._found_batch, []
+            self.photos_batch_found.emit(batch)
     
     def run(self):
         """Main scanning thread execution"""
         try:
             self.scanning_started.emit(self.root_path)
             
-            # First pass: count total files
-            self.total_files = self._count_files(self.root_path)
+            # First pass: list folders and count total files
+            folders = self._list_folders(self.root_path)
             
-            # Second pass: process files
-            self._scan_directory(self.root_path)
+            # Second pass: process the files listed above without re-walking
+            self._scan_directory(self.root_path, folders)
             
             self.scanning_finished.emit(self.photos_found)
             
         except Exception as e:
             self.error_occurred.emit(f"Scanning error: {str(e)}", self.root_path)
     
-    def _count_files(self, root_path: str) -> int:
-        """Count total files for progress tracking"""
-        total = 0
-        supported_formats = set(ext.lower() for ext in self.config.get_supported_formats())
-        video_formats = set(ext.lower() for ext in self.config.get_video_formats())
-        all_formats = supported_formats | video_formats
+    def _walk_directories(self, root_path: str):
+        """Yield (folder, media file names) for every visible folder under root_path
         
+        Folders are listed by a small thread pool so that slow (e.g. network)
+        directory reads overlap instead of being waited on one at a time.
+        """
+        stop_requested = self._stop_event.is_set
+        ext_match = self._ext_re
+        walkers = ThreadPoolExecutor(max_workers=self.config.get_scan_threads())
+        pending = {walkers.submit(_list_directory, root_path, ext_match)}
         try:
-            for root, dirs, files in os.walk(root_path):
-                # Skip hidden directories
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                
-                for file in files:
-                    if self._should_stop():
-                        return total
-                    
-                    _, ext = os.path.splitext(file.lower())
-                    if ext in all_formats:
-                        total += 1
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, subdirs, files = future.result()
+                    if not stop_requested():
+                        for subdir in subdirs:
+                            pending.add(walkers.submit(_list_directory, subdir, ext_match))
+                    yield folder, files
+        finally:
+            for future in pending:
+                future.cancel()
+            walkers.shutdown(wait=True)
+    
+    def _list_folders(self, root_path: str) -> List[Tuple[str, List[str]]]:
+        """Walk root_path once, keeping each folder's media files for the scan pass
+        
+        Also counts total files for progress tracking as folders arrive.
+        """
+        folders = []
+        stop_requested = self._stop_event.is_set
+        
+        try:
+            # Walker threads already dropped non-media files
+            for root, files in self._walk_directories(root_path):
+                if stop_requested():
+                    break
+                folders.append((root, files))
+                self.total_files += len(files)
         except Exception:
             pass
         
-        return total
+        return folders
     
-    def _scan_directory(self, root_path: str):
-        """Recursively scan directory for photos"""
-        supported_formats = set(ext.lower() for ext in self.config.get_supported_formats())
-        video_formats = set(ext.lower() for ext in self.config.get_video_formats())
-        all_formats = supported_formats | video_formats
+    def _scan_directory(self, root_path: str, folders: List[Tuple[str, List[str]]]):
+        """Scan the listed folders for photos"""
+        stop_requested = self._stop_event.is_set
         
-        processed = 0
+        # EXIF parsing holds the GIL, so optionally fan it out to processes
+        executor = None
+        if self.config.is_process_pool_enabled():
+            # Spawn rather than fork: by now the GUI, decode and writer threads
+            # are running, and a forked child could inherit one of their locks
+            # held mid-operation and hang
+            executor = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                           mp_context=multiprocessing.get_context("spawn"))
+        pending = []
+        batch = []
         
         try:
-            for root, dirs, files in os.walk(root_path):
-                if self._should_stop():
+            for root, files in folders:
+                if stop_requested():
                     break
                 
-                # Skip hidden directories
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                
                 self.current_folder = root
                 
                 for file in files:
-                    if self._should_stop():
+                    if stop_requested():
                         break
                     
-                    processed += 1
-                    self.progress_updated.emit(processed, self.total_files)
-                    
                     file_path = os.path.join(root, file)
-                    _, ext = os.path.splitext(file.lower())
                     
-                    if ext in all_formats:
-                        try:
-                            photo_info = self._extract_photo_info(file_path)
-                            if photo_info:
-                                self.photo_found.emit(photo_info)
-                                self.photos_found += 1
-                        except Exception as e:
-                            self.error_occurred.emit(f"Error processing {file}: {str(e)}", file_path)
+                    if executor is not None:
+                        batch.append(file_path)
+                        if len(batch) >= self.PROCESS_BATCH_SIZE:
+                            pending.append(executor.submit(_extract_photo_info_batch, batch))
+                            batch = []
+                        continue
+                    
+                    self.processed_files += 1
+                    
+                    try:
+                        photo_info = self._extract_photo_info(file_path)
+                        if photo_info:
+                            self._add_found_photo(photo_info)
+                    except Exception as e:
+                        self.error_occurred.emit(f"Error processing {file}: {str(e)}", file_path)
+            
+            if executor is not None:
+                if batch and not stop_requested():
+                    pending.append(executor.submit(_extract_photo_info_batch, batch))
+                
+                for future in pending:
+                    if stop_requested():
+                        break
+                    
+                    for file_path, fields, error in future.result():
+                        self.processed_files += 1
+                        
+                        if error is not None:
+                            self.error_occurred.emit(f"Failed to extract info from {file_path}: {error}", file_path)
+                        elif fields:
+                            self._add_found_photo(PhotoInfo(**fields))
                             
         except Exception as e:
             self.error_occurred.emit(f"Directory scanning error: {str(e)}", root_path)
-    
-    def _should_stop(self) -> bool:
-        """Check if scanning should stop"""
-        with QMutexLocker(self.mutex):
-            return self.should_stop
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            self._flush_found_photos()
     
     def _extract_photo_info(self, file_path: str) -> Optional[PhotoInfo]:
         """Extract comprehensive photo information"""
         try:
-            if not os.path.exists(file_path):
-                return None
-            
-            # Basic file info
-            stat = os.stat(file_path)
-            file_name = os.path.basename(file_path)
-            file_size = stat.st_size
-            modification_time = datetime.fromtimestamp(stat.st_mtime)
-            creation_time = datetime.fromtimestamp(stat.st_ctime)
-            folder_path = os.path.dirname(file_path)
-            
-            # File format
-            _, ext = os.path.splitext(file_path.lower())
-            format_name = ext[1:].upper() if ext else "UNKNOWN"
-            
-            # Initialize dimensions
-            width, height = 0, 0
-            exif_data = None
-            
-            # Try to get image info and EXIF data
-            try:
-                with Image.open(file_path) as img:
-                    width, height = img.size
-                    
-                    # Extract EXIF data
-                    if hasattr(img, '_getexif') and img._getexif() is not None:
-                        exif_dict = {}
-                        exif = img._getexif()
-                        
-                        for tag_id, value in exif.items():
-                            tag = TAGS.get(tag_id, tag_id)
-                            exif_dict[tag] = value
-                        
-                        exif_data = exif_dict
-                        
-                        # Try to get better creation time from EXIF
-                        if 'DateTime' in exif_data:
-                            try:
-                                exif_time = datetime.strptime(exif_data['DateTime'], '%Y:%m:%d %H:%M:%S')
-                                creation_time = exif_time
-                            except ValueError:
-                                pass
-                        elif 'DateTimeOriginal' in exif_data:
-                            try:
-                                exif_time = datetime.strptime(exif_data['DateTimeOriginal'], '%Y:%m:%d %H:%M:%S')
-                                creation_time = exif_time
-                            except ValueError:
-                                pass
-                                
-            except Exception:
-                # If image processing fails, it might be a video or corrupted file
-                # For videos, we'll handle them differently
-                pass
-            
-            # Generate file hash for duplicate detection
-            file_hash = self._generate_file_hash(file_path)
-            
-            return PhotoInfo(
-                file_path=file_path,
-                file_name=file_name,
-                file_size=file_size,
-                creation_time=creation_time,
-                modification_time=modification_time,
-                width=width,
-                height=height,
-                format=format_name,
-                folder_path=folder_path,
-                exif_data=exif_data,
-                file_hash=file_hash
-            )
-            
+            fields = _read_photo_fields(file_path)
+            return PhotoInfo(**fields) if fields else None
         except Exception as e:
             self.error_occurred.emit(f"Failed to extract info from {file_path}: {str(e)}", file_path)
             return None
-    
-    def _generate_file_hash(self, file_path: str) -> str:
-        """Generate MD5 hash for file duplicate detection"""
-        try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                # Read in chunks for large files
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except Exception:
-            return ""
 
 
 class PhotoDatabase:
     """In-memory photo database with fast search capabilities"""
     
+    # Bytes hashed to split size collisions before hashing whole files
+    QUICK_HASH_BYTES = 64 * 1024
+    
     def __init__(self):
         self.photos: List[PhotoInfo] = []
         self.photos_by_folder: Dict[str, List[PhotoInfo]] = {}
         self.photos_by_hash: Dict[str, PhotoInfo] = {}
+        self.photos_by_size: Dict[int, List[PhotoInfo]] = {}
         self.mutex = QMutex()
     
     def add_photo(self, photo_info: PhotoInfo):
         """Add photo to database"""
         with QMutexLocker(self.mutex):
-            self.photos.append(photo_info)
-            
-            # Index by folder
-            folder = photo_info.folder_path
-            if folder not in self.photos_by_folder:
-                self.photos_by_folder[folder] = []
-            self.photos_by_folder[folder].append(photo_info)
-            
-            # Index by hash for duplicate detection
-            if photo_info.file_hash:
-                self.photos_by_hash[photo_info.file_hash] = photo_info
+            self._index_photo(photo_info)
+    
+    def add_photos(self, photos: List[PhotoInfo]):
+        """Add a batch of photos to database under a single lock"""
+        with QMutexLocker(self.mutex):
+            for photo_info in photos:
+                self._index_photo(photo_info)
+    
+    def _index_photo(self, photo_info: PhotoInfo):
+        """Store and index a photo; caller must hold the mutex"""
+        self.photos.append(photo_info)
+        
+        # Index by folder
+        folder = photo_info.folder_path
+        if folder not in self.photos_by_folder:
+            self.photos_by_folder[folder] = []
+        self.photos_by_folder[folder].append(photo_info)
+        
+        # Index by size; only size collisions are ever hashed
+        size = photo_info.file_size
+        if size not in self.photos_by_size:
+            self.photos_by_size[size] = []
+        self.photos_by_size[size].append(photo_info)
+        
+        # Index by hash for duplicate detection
+        if photo_info.file_hash:
+            self.photos_by_hash[photo_info.file_hash] = photo_info
     
     def get_all_photos(self) -> List[PhotoInfo]:
         """Get all photos sorted by creation time (newest first)"""
         with QMutexLocker(self.mutex):
-            return sorted(self.photos, key=lambda p: p.creation_time, reverse=True)
+            return sorted(self.photos, key=attrgetter('creation_timestamp'), reverse=True)
     
     def get_photos_by_folder(self, folder_path: str) -> List[PhotoInfo]:
         """Get photos in specific folder"""
@@ -303,17 +496,42 @@ class PhotoDatabase:
             self.photos.clear()
             self.photos_by_folder.clear()
             self.photos_by_hash.clear()
+            self.photos_by_size.clear()
     
     def find_duplicates(self) -> List[List[PhotoInfo]]:
-        """Find duplicate photos by hash"""
+        """Find duplicate photos by hash, hashing only files whose sizes collide"""
         with QMutexLocker(self.mutex):
-            hash_groups = {}
-            
-            for photo in self.photos:
-                if photo.file_hash:
-                    if photo.file_hash not in hash_groups:
-                        hash_groups[photo.file_hash] = []
-                    hash_groups[photo.file_hash].append(photo)
+            size_groups = [list(group) for group in self.photos_by_size.values()
+                           if len(group) > 1]
+        
+        duplicates = []
+        for size_group in size_groups:
+            # Cheap pass over the leading bytes to split most collisions
+            quick_groups = {}
+            for photo in size_group:
+                quick_hash = _hash_file(photo.file_path, self.QUICK_HASH_BYTES)
+                if quick_hash:
+                    if photo.file_size <= self.QUICK_HASH_BYTES:
+                        # The quick hash already covered the whole file
+                        photo.file_hash = quick_hash
+                    quick_groups.setdefault(quick_hash, []).append(photo)
             
-            # Return groups with more than one photo
-            return [group for group in hash_groups.values() if len(group) > 1]
\ No newline at end of file
+            for candidates in quick_groups.values():
+                if len(candidates) < 2:
+                    continue
+                
+                hash_groups = {}
+                for photo in candidates:
+                    if not photo.file_hash:
+                        photo.file_hash = _hash_file(photo.file_path)
+                    if photo.file_hash:
+                        hash_groups.setdefault(photo.file_hash, []).append(photo)
+                
+                with QMutexLocker(self.mutex):
+                    for file_hash, group in hash_groups.items():
+                        self.photos_by_hash[file_hash] = group[-1]
+                
+                # Return groups with more than one photo
+                duplicates.extend(group for group in hash_groups.values() if len(group) > 1)
+        
+        return duplicates
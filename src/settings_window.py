@@ -6,15 +6,107 @@ Modern settings interface for photo path configuration and preferences
 """
 
 import os
+import time
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
                              QLabel, QLineEdit, QPushButton, QFileDialog,
                              QGroupBox, QCheckBox, QSlider, QComboBox,
                              QSpinBox, QTextEdit, QTabWidget, QWidget,
                              QMessageBox, QProgressBar)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QFont, QIcon
 
 
+# Static label texts shared by every dialog instance
+_APP_TITLE = "现代照片查看器"
+
+_FORMATS_TEXT = ("支持的图片格式：JPG、PNG、GIF、BMP、TIFF、WebP、ICO、SVG\n"
+                 "支持的视频格式：MP4、AVI、MOV、MKV、WMV、FLV、WebM")
+
+_TIPS_TEXT = """• 将照片集合按子文件夹有序组织
+• 使用 SSD 存储以提高缩略图加载性能
+• 为经常访问的照片启用缓存
+• 关闭其他资源密集型应用程序
+• 对于非常大的集合，考虑减小缩略图尺寸
+• 增加最大缓存大小可提高浏览性能"""
+
+_DESC_TEXT = """专为管理而设计的高性能照片和视频查看器
+具有现代、美观界面的大型照片集。
+
+特征：
+• 快速扫描和索引数千张照片
+• 智能缩略图缓存以实现最佳性能
+• 基于时间的照片组织
+• 基于文件夹的浏览
+• 详细的照片信息和元数据
+• 现代深色/浅色主题
+• 视频播放支持"""
+
+_WELCOME_TEXT = """要开始使用，请选择存放照片的主文件夹。
+应用程序将自动扫描所有子文件夹并按日期组织您的照片。
+
+这是一次性设置 - 您可以后续在设置中更改。"""
+
+
+def directory_dialog_options(config):
+    """Get QFileDialog options for picking a photo directory"""
+    options = (QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks |
+               QFileDialog.DontUseCustomDirectoryIcons)
+    if not config.use_native_file_dialogs():
+        options |= QFileDialog.DontUseNativeDialog
+    return options
+
+
+def _scan_cache_dir(cache_dir):
+    """Sum the size and count of cached thumbnails in one directory pass"""
+    total_size = 0
+    file_count = 0
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('thumb_') and name.endswith('.png'):
+                    try:
+                        total_size += entry.stat().st_size
+                        file_count += 1
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+    return total_size, file_count
+
+
+def caption_label(text):
+    """Create a static, pre-wrapped plain text label
+    
+    Plain text skips Qt's rich text detection, and the hard line breaks in
+    the text replace word wrapping, which is recomputed on every resize.
+    """
+    label = QLabel(text)
+    label.setTextFormat(Qt.PlainText)
+    label.setTextInteractionFlags(Qt.NoTextInteraction)
+    return label
+
+
+class WorkerSignals(QObject):
+    """Signals for Worker; QRunnable itself cannot emit"""
+    result = pyqtSignal(object)
+
+
+class Worker(QRunnable):
+    """Runs a blocking call on the global thread pool and emits its result"""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        """Execute the call on a pool thread"""
+        self.signals.result.emit(self.fn(*self.args))
+
+
 class SettingsWindow(QDialog):
     """Modern settings window with tabbed interface"""
     
@@ -22,11 +114,27 @@ class SettingsWindow(QDialog):
     settings_applied = pyqtSignal()
     photo_path_changed = pyqtSignal(str)
     
+    # Seconds a path existence check is trusted before re-statting
+    PATH_CHECK_TTL = 2.0
+    
+    # (cache dir mtime, total bytes, file count), shared across dialog instances
+    _cache_info_cache = None
+    
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
+        # Settings are read once per dialog and compared against on apply
+        self._cfg = self.config.snapshot()
+        # Set by a reset, which changes config without going through apply
+        self._reset_pending = False
+        # path -> (monotonic time checked, exists)
+        self._exists_cache = {}
+        self._path_worker = None
+        self._cache_worker = None
+        self._cache_info_box = None
+        # Created on first use by _ask
+        self._confirm_box = None
         self.setup_ui()
-        self.load_settings()
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
     
     def setup_ui(self):
@@ -41,30 +149,36 @@ class SettingsWindow(QDialog):
         
         # Title
         title_label = QLabel("设置")
-        title_label.setProperty("labelStyle", "heading")
+        title_label.setObjectName("headingLabel")
         layout.addWidget(title_label)
         
         # Tab widget
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Create tabs
-        self.create_general_tab()
-        self.create_appearance_tab()
-        self.create_performance_tab()
-        self.create_about_tab()
+        # Create placeholder tabs; each is populated the first time it is shown
+        self._tab_builders = {}
+        self._built_tabs = set()
+        for key, title, builder in (('general', "常规", self.create_general_tab),
+                                    ('appearance', "外观", self.create_appearance_tab),
+                                    ('performance', "性能", self.create_performance_tab),
+                                    ('about', "关于", self.create_about_tab)):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = (key, builder)
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(self.tab_widget.currentIndex())
         
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
         self.reset_button = QPushButton("重置为默认值")
-        self.reset_button.setProperty("buttonStyle", "secondary")
+        self.reset_button.setObjectName("secondaryButton")
         self.reset_button.clicked.connect(self.reset_settings)
         button_layout.addWidget(self.reset_button)
         
         self.cancel_button = QPushButton("取消")
-        self.cancel_button.setProperty("buttonStyle", "secondary")
+        self.cancel_button.setObjectName("secondaryButton")
         self.cancel_button.clicked.connect(self.reject)
         button_layout.addWidget(self.cancel_button)
         
@@ -74,9 +188,19 @@ class SettingsWindow(QDialog):
         
         layout.addLayout(button_layout)
     
-    def create_general_tab(self):
+    def _ensure_tab(self, index):
+        """Build a tab's widgets and load its settings on first display"""
+        entry = self._tab_builders.pop(index, None)
+        if entry is None:
+            return
+        
+        key, builder = entry
+        builder(self.tab_widget.widget(index))
+        self._built_tabs.add(key)
+        self._load_tab_settings(key)
+    
+    def create_general_tab(self, tab):
         """Create general settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         layout.setSpacing(16)
         
@@ -96,10 +220,9 @@ class SettingsWindow(QDialog):
         path_layout.addWidget(self.browse_button, 0, 2)
         
         # Path info
-        info_label = QLabel("选择存放照片的主文件夹。"
-                           "应用程序将自动扫描所有子文件夹。")
-        info_label.setProperty("labelStyle", "caption")
-        info_label.setWordWrap(True)
+        info_label = caption_label("选择存放照片的主文件夹。\n"
+                                   "应用程序将自动扫描所有子文件夹。")
+        info_label.setObjectName("captionLabel")
         path_layout.addWidget(info_label, 1, 0, 1, 3)
         
         layout.addWidget(path_group)
@@ -120,19 +243,16 @@ class SettingsWindow(QDialog):
         formats_group = QGroupBox("支持的文件格式")
         formats_layout = QVBoxLayout(formats_group)
         
-        formats_info = QLabel("支持的图片格式：JPG、PNG、GIF、BMP、TIFF、WebP、ICO、SVG\n"
-                             "支持的视频格式：MP4、AVI、MOV、MKV、WMV、FLV、WebM")
-        formats_info.setProperty("labelStyle", "caption")
+        formats_info = caption_label(_FORMATS_TEXT)
+        formats_info.setObjectName("captionLabel")
         formats_layout.addWidget(formats_info)
         
         layout.addWidget(formats_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "常规")
     
-    def create_appearance_tab(self):
+    def create_appearance_tab(self, tab):
         """Create appearance settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         layout.setSpacing(16)
         
@@ -142,11 +262,12 @@ class SettingsWindow(QDialog):
         
         theme_layout.addWidget(QLabel("颜色主题:"), 0, 0)
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["深色（推荐）", "浅色"])
+        self.theme_combo.addItem("深色（推荐）", "dark")
+        self.theme_combo.addItem("浅色", "light")
         theme_layout.addWidget(self.theme_combo, 0, 1)
         
-        theme_info = QLabel("深色主题经过优化，可更好地浏览照片，对比度更高。")
-        theme_info.setProperty("labelStyle", "caption")
+        theme_info = caption_label("深色主题经过优化，可更好地浏览照片，对比度更高。")
+        theme_info.setObjectName("captionLabel")
         theme_layout.addWidget(theme_info, 1, 0, 1, 2)
         
         layout.addWidget(theme_group)
@@ -157,13 +278,19 @@ class SettingsWindow(QDialog):
         
         thumb_layout.addWidget(QLabel("缩略图大小:"), 0, 0)
         
+        # Every label text the slider can show, formatted once
+        self._size_strings = tuple(f"{i}px" for i in range(100, 401))
+        
         size_layout = QHBoxLayout()
         self.size_slider = QSlider(Qt.Horizontal)
         self.size_slider.setRange(100, 400)
         self.size_slider.setValue(200)
+        # Only commit the value on release; drags just preview the label
+        self.size_slider.setTracking(False)
+        self.size_slider.sliderMoved.connect(self.update_size_label)
         self.size_slider.valueChanged.connect(self.update_size_label)
         
-        self.size_label = QLabel("200px")
+        self.size_label = QLabel(self._size_strings[200 - 100])
         self.size_label.setMinimumWidth(50)
         
         size_layout.addWidget(self.size_slider)
@@ -173,11 +300,9 @@ class SettingsWindow(QDialog):
         layout.addWidget(thumb_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "外观")
     
-    def create_performance_tab(self):
+    def create_performance_tab(self, tab):
         """Create performance settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         layout.setSpacing(15)
         
@@ -188,7 +313,6 @@ class SettingsWindow(QDialog):
         
         # Enable cache
         self.cache_enabled_check = QCheckBox("启用缩略图缓存")
-        self.cache_enabled_check.setChecked(bool(self.config.is_cache_enabled()))
         cache_layout.addWidget(self.cache_enabled_check, 0, 0, 1, 2)
         
         # Cache size
@@ -197,27 +321,22 @@ class SettingsWindow(QDialog):
         
         self.cache_size_spin = QSpinBox()
         self.cache_size_spin.setRange(100, 20000)  # Updated to 20GB maximum
-        max_cache_size = self.config.get('max_cache_size', 20000)
-        # Ensure we have an integer value
-        if isinstance(max_cache_size, str):
-            max_cache_size = int(max_cache_size)
-        self.cache_size_spin.setValue(int(max_cache_size))
         cache_layout.addWidget(self.cache_size_spin, 1, 1)
         
         # Cache info
-        cache_info = QLabel("缓存缩略图可以显著提高浏览速度，特别是在处理大量照片时。")
-        cache_info.setProperty("labelStyle", "caption")
-        cache_info.setWordWrap(True)
+        cache_info = caption_label("缓存缩略图可以显著提高浏览速度，\n"
+                                   "特别是在处理大量照片时。")
+        cache_info.setObjectName("captionLabel")
         cache_layout.addWidget(cache_info, 2, 0, 1, 2)
         
         # Cache management buttons
         cache_buttons = QHBoxLayout()
         self.clear_cache_button = QPushButton("清除缓存")
-        self.clear_cache_button.setProperty("buttonStyle", "secondary")
+        self.clear_cache_button.setObjectName("secondaryButton")
         self.clear_cache_button.clicked.connect(self.clear_cache)
         
         self.cache_info_button = QPushButton("缓存信息")
-        self.cache_info_button.setProperty("buttonStyle", "secondary")
+        self.cache_info_button.setObjectName("secondaryButton")
         self.cache_info_button.clicked.connect(self.show_cache_info)
         
         cache_buttons.addWidget(self.clear_cache_button)
@@ -232,172 +351,240 @@ class SettingsWindow(QDialog):
         tips_group = QGroupBox("性能提示")
         tips_layout = QVBoxLayout(tips_group)
         
-        tips_text = """• 将照片集合按子文件夹有序组织
-• 使用 SSD 存储以提高缩略图加载性能
-• 为经常访问的照片启用缓存
-• 关闭其他资源密集型应用程序
-• 对于非常大的集合，考虑减小缩略图尺寸
-• 增加最大缓存大小可提高浏览性能"""
-        
-        tips_label = QLabel(tips_text)
-        tips_label.setProperty("labelStyle", "caption")
-        tips_label.setWordWrap(True)
+        tips_label = caption_label(_TIPS_TEXT)
+        tips_label.setObjectName("captionLabel")
         tips_layout.addWidget(tips_label)
         
         layout.addWidget(tips_group)
         
         layout.addStretch()
-        self.tab_widget.addTab(tab, "性能")
     
-    def create_about_tab(self):
+    def create_about_tab(self, tab):
         """Create about tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         layout.setSpacing(20)
         
         # App info
-        app_label = QLabel("现代照片查看器")
-        app_label.setProperty("labelStyle", "heading")
+        app_label = QLabel(_APP_TITLE)
+        app_label.setObjectName("headingLabel")
         app_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(app_label)
         
         version_label = QLabel("版本 1.0.0")
-        version_label.setProperty("labelStyle", "subheading")
+        version_label.setObjectName("subheadingLabel")
         version_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(version_label)
         
         # Description
-        desc_text = """专为管理而设计的高性能照片和视频查看器
-具有现代、美观界面的大型照片集。
-
-特征：
-• 快速扫描和索引数千张照片
-• 智能缩略图缓存以实现最佳性能
-• 基于时间的照片组织
-• 基于文件夹的浏览
-• 详细的照片信息和元数据
-• 现代深色/浅色主题
-• 视频播放支持"""
-        
-        desc_label = QLabel(desc_text)
+        desc_label = caption_label(_DESC_TEXT)
         desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setWordWrap(True)
         layout.addWidget(desc_label)
         
         layout.addStretch()
         
         # Tech info
-        tech_label = QLabel("使用 PyQt5 构建• 由现代设计原则提供支持")
-        tech_label.setProperty("labelStyle", "caption")
+        tech_label = caption_label("使用 PyQt5 构建• 由现代设计原则提供支持")
+        tech_label.setObjectName("captionLabel")
         tech_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(tech_label)
-        
-        self.tab_widget.addTab(tab, "关于")
     
     def browse_photo_path(self):
         """Browse for photo directory"""
         current_path = self.path_edit.text()
-        if not current_path or not os.path.exists(current_path):
+        if not current_path or not self._path_exists(current_path):
             current_path = os.path.expanduser("~")
         
         path = QFileDialog.getExistingDirectory(
             self, 
             "选择照片目录",
             current_path,
-            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
+            directory_dialog_options(self.config)
         )
         
         if path:
+            # The dialog only returns existing directories
+            self._remember_path(path, True)
             self.path_edit.setText(path)
     
+    def _remember_path(self, path, exists):
+        """Cache the result of a path existence check"""
+        self._exists_cache[path] = (time.monotonic(), exists)
+    
+    def _cached_path_exists(self, path):
+        """Get a recent existence check for path, or None if there is none"""
+        entry = self._exists_cache.get(path)
+        if entry and time.monotonic() - entry[0] < self.PATH_CHECK_TTL:
+            return entry[1]
+        return None
+    
+    def _path_exists(self, path):
+        """Check whether path exists, reusing a recent result if available"""
+        exists = self._cached_path_exists(path)
+        if exists is None:
+            exists = os.path.exists(path)
+            self._remember_path(path, exists)
+        return exists
+    
+    def _check_path_async(self, path):
+        """Stat path on the thread pool, then retry applying settings"""
+        self.apply_button.setEnabled(False)
+        self._path_worker = Worker(os.path.exists, path)
+        self._path_worker.signals.result.connect(
+            lambda exists: self._on_path_checked(path, exists))
+        QThreadPool.globalInstance().start(self._path_worker)
+    
+    def _on_path_checked(self, path, exists):
+        """Handle a background path check finishing"""
+        self._path_worker = None
+        self._remember_path(path, exists)
+        self.apply_button.setEnabled(True)
+        if self.isVisible():
+            self.apply_settings()
+    
     def update_size_label(self, value):
-        """Update thumbnail size label"""
-        self.size_label.setText(f"{value}px")
+        """Update thumbnail size label, also previewing it while dragging"""
+        self.size_label.setText(self._size_strings[value - 100])
     
     def load_settings(self):
-        """Load current settings"""
-        # General settings
-        self.path_edit.setText(self.config.get_photo_path())
-        self.auto_scan_check.setChecked(bool(self.config.is_auto_scan_enabled()))
-        self.hidden_files_check.setChecked(bool(self.config.get('show_hidden_files', False)))
-        
-        # Appearance settings
-        theme = self.config.get_theme()
-        self.theme_combo.setCurrentIndex(0 if theme == 'dark' else 1)
-        
-        thumbnail_size = self.config.get_thumbnail_size()
-        self.size_slider.setValue(thumbnail_size)
-        self.update_size_label(thumbnail_size)
-        
-        # Performance settings
-        self.cache_enabled_check.setChecked(bool(self.config.is_cache_enabled()))
-        max_cache_size = self.config.get('max_cache_size', 500)
-        # Ensure we have an integer value
-        if isinstance(max_cache_size, str):
-            max_cache_size = int(max_cache_size)
-        self.cache_size_spin.setValue(int(max_cache_size))
+        """Load current settings into every tab built so far"""
+        for key in self._built_tabs:
+            self._load_tab_settings(key)
+    
+    def reload_settings(self):
+        """Re-read config and refresh the widgets, e.g. before reopening"""
+        self._cfg = self.config.snapshot()
+        self.load_settings()
+    
+    def _load_tab_settings(self, key):
+        """Load the settings shown on one tab"""
+        loader = {
+            'general': self._load_general_settings,
+            'appearance': self._load_appearance_settings,
+            'performance': self._load_performance_settings,
+        }.get(key)
+        if loader:
+            loader()
+    
+    @staticmethod
+    @contextmanager
+    def _quiet(*widgets):
+        """Block the widgets' signals while their values are restored"""
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            yield
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+    
+    def _load_general_settings(self):
+        """Load general tab settings"""
+        with self._quiet(self.path_edit, self.auto_scan_check, self.hidden_files_check):
+            self.path_edit.setText(self._cfg['photo_path'])
+            self.auto_scan_check.setChecked(self._cfg['auto_scan'])
+            self.hidden_files_check.setChecked(self._cfg['show_hidden_files'])
+    
+    def _load_appearance_settings(self):
+        """Load appearance tab settings"""
+        thumbnail_size = self._cfg['thumbnail_size']
+        with self._quiet(self.theme_combo, self.size_slider):
+            index = self.theme_combo.findData(self._cfg['theme'])
+            self.theme_combo.setCurrentIndex(max(index, 0))
+            self.size_slider.setValue(thumbnail_size)
+        # The slider clamps stored sizes outside 100-400 to its range
+        self.update_size_label(self.size_slider.value())
+    
+    def _load_performance_settings(self):
+        """Load performance tab settings"""
+        with self._quiet(self.cache_enabled_check, self.cache_size_spin):
+            self.cache_enabled_check.setChecked(self._cfg['cache_thumbnails'])
+            self.cache_size_spin.setValue(self._cfg['max_cache_size'])
+    
+    def _collect_settings(self):
+        """Read the values currently shown in the built tabs"""
+        settings = {
+            'photo_path': self.path_edit.text().strip(),
+            'auto_scan': self.auto_scan_check.isChecked(),
+            'show_hidden_files': self.hidden_files_check.isChecked(),
+        }
+        
+        # Tabs never opened still hold the stored values, so skip them
+        if 'appearance' in self._built_tabs:
+            settings['theme'] = self.theme_combo.currentData()
+            settings['thumbnail_size'] = self.size_slider.value()
+        
+        if 'performance' in self._built_tabs:
+            settings['cache_thumbnails'] = self.cache_enabled_check.isChecked()
+            settings['max_cache_size'] = self.cache_size_spin.value()
+        
+        return settings
     
     def apply_settings(self):
         """Apply and save settings"""
         try:
-            # General settings
-            old_path = self.config.get_photo_path()
-            new_path = self.path_edit.text().strip()
+            changes = {key: value for key, value in self._collect_settings().items()
+                       if self._cfg.get(key) != value}
+            
+            # Nothing edited: close without waking up theme/thumbnail reloads.
+            # A reset already wrote new values, so it still has to be applied
+            if not changes and not self._reset_pending:
+                self.accept()
+                return
             
-            if new_path != old_path:
-                if new_path and not os.path.exists(new_path):
+            new_path = changes.get('photo_path')
+            if new_path:
+                # Slow mounts can block on stat, so never check on the GUI thread
+                exists = self._cached_path_exists(new_path)
+                if exists is None:
+                    self._check_path_async(new_path)
+                    return
+                if not exists:
                     QMessageBox.warning(self, "无效路径", 
                                       "所选照片目录不存在。")
                     return
-                
-                self.config.set_photo_path(new_path)
-                if new_path:
-                    self.photo_path_changed.emit(new_path)
             
-            self.config.set_auto_scan(bool(self.auto_scan_check.isChecked()))
-            self.config.set('show_hidden_files', bool(self.hidden_files_check.isChecked()))
+            # Buffer every change and write the settings file once
+            with self.config.batch():
+                for key, value in changes.items():
+                    self.config.set(key, value)
+            self._cfg.update(changes)
             
-            # Appearance settings
-            theme = 'dark' if self.theme_combo.currentIndex() == 0 else 'light'
-            self.config.set_theme(theme)
-            
-            self.config.set_thumbnail_size(self.size_slider.value())
-            
-            # Performance settings
-            self.config.set('cache_thumbnails', bool(self.cache_enabled_check.isChecked()))
-            self.config.set('max_cache_size', int(self.cache_size_spin.value()))
+            if new_path:
+                self.photo_path_changed.emit(new_path)
             
+            self._reset_pending = False
             self.settings_applied.emit()
             self.accept()
             
         except Exception as e:
             QMessageBox.critical(self, "错误", f"保存设置失败：{str(e)}")
     
+    def _ask(self, title, text):
+        """Ask a yes/no question, reusing one message box per dialog"""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Question)
+            self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        
+        self._confirm_box.setDefaultButton(QMessageBox.No)
+        self._confirm_box.setWindowTitle(title)
+        self._confirm_box.setText(text)
+        return self._confirm_box.exec_() == QMessageBox.Yes
+    
     def reset_settings(self):
         """Reset all settings to defaults"""
-        reply = QMessageBox.question(
-            self, "重置设置",
-            "确定要将所有设置重置为默认值吗？\n"
-            "此操作无法撤销。",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
+        if self._ask("重置设置",
+                     "确定要将所有设置重置为默认值吗？\n"
+                     "此操作无法撤销。"):
             self.config.reset_to_defaults()
-            self.load_settings()
+            self._reset_pending = True
+            self.reload_settings()
     
     def clear_cache(self):
         """Clear thumbnail cache"""
-        reply = QMessageBox.question(
-            self, "清除缓存",
-            "确定要清除缩略图缓存吗？\n"
-            "这将释放磁盘空间，但缩略图需要重新生成。",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
+        if self._ask("清除缓存",
+                     "确定要清除缩略图缓存吗？\n"
+                     "这将释放磁盘空间，但缩略图需要重新生成。"):
             try:
                 # This would clear the cache - we'll implement this later
                 QMessageBox.information(self, "缓存已清除", 
@@ -408,18 +595,51 @@ class SettingsWindow(QDialog):
     def show_cache_info(self):
         """Show cache information"""
         try:
-            # This would show cache info - we'll implement this later
-            cache_size = "~150 MB"  # Placeholder
-            cache_files = "1,247 files"  # Placeholder
+            cache_dir = self.config.get_cache_dir()
+            dir_mtime = os.stat(cache_dir).st_mtime
+            
+            # One box per dialog, reused like the confirmation box in _ask
+            if self._cache_info_box is None:
+                self._cache_info_box = QMessageBox(QMessageBox.Information, "缓存信息",
+                                                   "", QMessageBox.Ok, self)
+            
+            # A scan is already running and will fill in the box when done
+            if self._cache_worker is not None:
+                self._cache_info_box.open()
+                return
             
-            QMessageBox.information(
-                self, "缓存信息",
-                f"缓存大小：{cache_size}\n"
-                f"缓存文件：{cache_files}\n"
-                f"缓存位置：{self.config.get_cache_dir()}"
-            )
+            # Adding or removing thumbnails bumps the directory mtime
+            cached = SettingsWindow._cache_info_cache
+            if cached and cached[0] == dir_mtime:
+                self._cache_info_box.setText(
+                    self._format_cache_info(cache_dir, cached[1], cached[2]))
+                self._cache_info_box.open()
+                return
+            
+            self._cache_info_box.setText(f"缓存大小：正在计算...\n"
+                                         f"缓存位置：{cache_dir}")
+            self._cache_info_box.open()
+            
+            self._cache_worker = Worker(_scan_cache_dir, cache_dir)
+            self._cache_worker.signals.result.connect(
+                lambda stats: self._on_cache_scanned(cache_dir, dir_mtime, stats))
+            QThreadPool.globalInstance().start(self._cache_worker)
         except Exception as e:
             QMessageBox.warning(self, "错误", f"获取缓存信息失败：{str(e)}")
+    
+    def _on_cache_scanned(self, cache_dir, dir_mtime, stats):
+        """Show the result of a background cache scan"""
+        self._cache_worker = None
+        total_size, file_count = stats
+        SettingsWindow._cache_info_cache = (dir_mtime, total_size, file_count)
+        if self._cache_info_box is not None and self._cache_info_box.isVisible():
+            self._cache_info_box.setText(self._format_cache_info(cache_dir, total_size, file_count))
+    
+    def _format_cache_info(self, cache_dir, total_size, file_count):
+        """Format cache statistics for display"""
+        return (f"缓存大小：{total_size / (1024 * 1024):,.1f} MB\n"
+                f"缓存文件：{file_count:,} 个文件\n"
+                f"缓存位置：{cache_dir}")
 
 
 class FirstRunDialog(QDialog):
@@ -442,18 +662,12 @@ class FirstRunDialog(QDialog):
         
         # Welcome message
         welcome_label = QLabel("欢迎使用现代照片查看器！")
-        welcome_label.setProperty("labelStyle", "heading")
+        welcome_label.setObjectName("headingLabel")
         welcome_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(welcome_label)
         
         # Description
-        desc_text = """要开始使用，请选择存放照片的主文件夹。
-应用程序将自动扫描所有子文件夹并按日期组织您的照片。
-
-这是一次性设置 - 您可以后续在设置中更改。"""
-        
-        desc_label = QLabel(desc_text)
-        desc_label.setWordWrap(True)
+        desc_label = caption_label(_WELCOME_TEXT)
         desc_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(desc_label)
         
@@ -482,7 +696,7 @@ class FirstRunDialog(QDialog):
         button_layout = QHBoxLayout()
         
         self.skip_button = QPushButton("暂时跳过")
-        self.skip_button.setProperty("buttonStyle", "secondary")
+        self.skip_button.setObjectName("secondaryButton")
         self.skip_button.clicked.connect(self.skip_setup)
         button_layout.addWidget(self.skip_button)
         
@@ -500,7 +714,7 @@ class FirstRunDialog(QDialog):
             self, 
             "选择照片目录",
             os.path.expanduser("~"),
-            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
+            directory_dialog_options(self.config)
         )
         
         if path:
@@ -519,7 +733,7 @@ class FirstRunDialog(QDialog):
         if photo_path:
             self.config.set_photo_path(photo_path)
         
-        self.config.set_auto_scan(bool(self.auto_scan_check.isChecked()))
+        self.config.set_auto_scan(self.auto_scan_check.isChecked())
         self.accept()
     
     def skip_setup(self):
@@ -6,722 +6,176 @@ Beautiful, modern styles for the photo viewer application
 Designed with young users' aesthetic preferences in mind
 """
 
+import os
+import re
+from functools import lru_cache
+from string import Template
+
+from PyQt5.QtGui import QColor, QPalette
+
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE_RE = re.compile(r"\s+")
+_QSS_PUNCT_RE = re.compile(r"\s*([{}:;,])\s*")
+
+# Color values, each spelled out once
+_WHITE = '#ffffff'
+_GREY = '#808080'
+_ACCENT = '#0d7377'
+_ACCENT_HOVER = '#14a085'
+_ACCENT_PRESSED = '#0a5d61'
+
+_DARK_BG = '#1e1e1e'
+_DARK_PANEL = '#252525'
+_DARK_SURFACE = '#2d2d2d'
+_DARK_BORDER = '#404040'
+_DARK_RAISED = '#505050'
+_DARK_RAISED_HOVER = '#606060'
+_DARK_MUTED = '#b0b0b0'
+
+_LIGHT_TEXT = '#333333'
+_LIGHT_PANEL = '#f8f8f8'
+_LIGHT_SURFACE = '#f5f5f5'
+_LIGHT_ROW = '#f0f0f0'
+_LIGHT_BORDER = '#e0e0e0'
+_LIGHT_PRESSED = '#d0d0d0'
+_LIGHT_HANDLE = '#c0c0c0'
+_LIGHT_HANDLE_HOVER = '#a0a0a0'
+
+# Colors for each theme, substituted into the shared stylesheet template
+_DARK_PALETTE = {
+    'bg': _DARK_BG,
+    'text': _WHITE,
+    'surface': _DARK_SURFACE,
+    'menu_bg': _DARK_SURFACE,
+    'input_bg': _DARK_SURFACE,
+    'border': _DARK_BORDER,
+    'hover': _DARK_BORDER,
+    'pressed': _DARK_RAISED,
+    'menu_selected': _DARK_BORDER,
+    'item_hover': _DARK_SURFACE,
+    'header_bg': _DARK_PANEL,
+    'panel_bg': _DARK_PANEL,
+    'caption': _DARK_MUTED,
+    'disabled_text': _GREY,
+    'scroll_handle': _DARK_RAISED,
+    'scroll_handle_hover': _DARK_RAISED_HOVER,
+    'accent': _ACCENT,
+    'accent_hover': _ACCENT_HOVER,
+    'accent_pressed': _ACCENT_PRESSED,
+    'accent_text': _WHITE,
+}
+
+_LIGHT_PALETTE = {
+    'bg': _WHITE,
+    'text': _LIGHT_TEXT,
+    'surface': _LIGHT_SURFACE,
+    'menu_bg': _WHITE,
+    'input_bg': _WHITE,
+    'border': _LIGHT_BORDER,
+    'hover': _LIGHT_BORDER,
+    'pressed': _LIGHT_PRESSED,
+    'menu_selected': _ACCENT,
+    'item_hover': _LIGHT_ROW,
+    'header_bg': _LIGHT_ROW,
+    'panel_bg': _LIGHT_PANEL,
+    'caption': _GREY,
+    'disabled_text': _GREY,
+    'scroll_handle': _LIGHT_HANDLE,
+    'scroll_handle_hover': _LIGHT_HANDLE_HOVER,
+    'accent': _ACCENT,
+    'accent_hover': _ACCENT_HOVER,
+    'accent_pressed': _ACCENT_PRESSED,
+    'accent_text': _WHITE,
+}
+
+# Palette for each theme name; unknown names fall back to the default theme
+_THEME_PALETTES = {
+    'dark': _DARK_PALETTE,
+    'light': _LIGHT_PALETTE,
+}
+
+# Layout shared by both themes, with $name fields for the palettes above
+_QSS_TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  'themes', 'theme.qss')
+
+
 def get_dark_theme_style():
     """Get dark theme stylesheet - modern and sleek"""
-    return """
-    QMainWindow {
-        background-color: #1e1e1e;
-        color: #ffffff;
-    }
-    
-    QWidget {
-        background-color: #1e1e1e;
-        color: #ffffff;
-        font-family: 'Segoe UI', Arial, sans-serif;
-    }
-    
-    /* Menu Bar */
-    QMenuBar {
-        background-color: #2d2d2d;
-        color: #ffffff;
-        border: none;
-        padding: 4px;
-    }
-    
-    QMenuBar::item {
-        background-color: transparent;
-        padding: 8px 12px;
-        border-radius: 4px;
-        margin: 2px;
-    }
-    
-    QMenuBar::item:selected {
-        background-color: #404040;
-    }
-    
-    QMenuBar::item:pressed {
-        background-color: #505050;
-    }
-    
-    QMenu {
-        background-color: #2d2d2d;
-        color: #ffffff;
-        border: 1px solid #404040;
-        border-radius: 6px;
-        padding: 4px;
-    }
-    
-    QMenu::item {
-        padding: 8px 20px;
-        border-radius: 4px;
-        margin: 1px;
-    }
-    
-    QMenu::item:selected {
-        background-color: #404040;
-    }
-    
-    /* Tool Bar */
-    QToolBar {
-        background-color: #2d2d2d;
-        border: none;
-        spacing: 6px;
-        padding: 8px;
-    }
-    
-    QToolButton {
-        background-color: transparent;
-        border: none;
-        border-radius: 6px;
-        padding: 8px 12px;
-        color: #ffffff;
-        font-weight: 500;
-    }
-    
-    QToolButton:hover {
-        background-color: #404040;
-    }
-    
-    QToolButton:pressed {
-        background-color: #505050;
-    }
-    
-    QToolButton:checked {
-        background-color: #0d7377;
-    }
-    
-    /* Buttons */
-    QPushButton {
-        background-color: #0d7377;
-        color: #ffffff;
-        border: none;
-        border-radius: 8px;
-        padding: 10px 20px;
-        font-weight: 600;
-        font-size: 14px;
-    }
-    
-    QPushButton:hover {
-        background-color: #14a085;
-    }
-    
-    QPushButton:pressed {
-        background-color: #0a5d61;
-    }
-    
-    QPushButton:disabled {
-        background-color: #404040;
-        color: #808080;
-    }
-    
-    /* Secondary Button */
-    QPushButton[buttonStyle="secondary"] {
-        background-color: #404040;
-        color: #ffffff;
-    }
-    
-    QPushButton[buttonStyle="secondary"]:hover {
-        background-color: #505050;
-    }
-    
-    /* Line Edit */
-    QLineEdit {
-        background-color: #2d2d2d;
-        border: 2px solid #404040;
-        border-radius: 8px;
-        padding: 8px 12px;
-        color: #ffffff;
-        font-size: 14px;
-    }
-    
-    QLineEdit:focus {
-        border-color: #0d7377;
-    }
-    
-    /* Labels */
-    QLabel {
-        color: #ffffff;
-        font-size: 14px;
-    }
-    
-    QLabel[labelStyle="heading"] {
-        font-size: 18px;
-        font-weight: bold;
-        color: #0d7377;
-    }
-    
-    QLabel[labelStyle="subheading"] {
-        font-size: 16px;
-        font-weight: 600;
-        color: #ffffff;
-    }
-    
-    QLabel[labelStyle="caption"] {
-        font-size: 12px;
-        color: #b0b0b0;
-    }
-    
-    /* List Widget */
-    QListWidget {
-        background-color: #1e1e1e;
-        border: 1px solid #404040;
-        border-radius: 8px;
-        padding: 4px;
-        outline: none;
-    }
-    
-    QListWidget::item {
-        border-radius: 6px;
-        padding: 8px;
-        margin: 2px;
-    }
-    
-    QListWidget::item:selected {
-        background-color: #0d7377;
-        color: #ffffff;
-    }
-    
-    QListWidget::item:hover {
-        background-color: #2d2d2d;
-    }
-    
-    /* Tree Widget */
-    QTreeWidget {
-        background-color: #1e1e1e;
-        border: 1px solid #404040;
-        border-radius: 8px;
-        outline: none;
-        alternate-background-color: #252525;
-    }
-    
-    QTreeWidget::item {
-        padding: 6px;
-        border-radius: 4px;
-        margin: 1px;
-    }
-    
-    QTreeWidget::item:selected {
-        background-color: #0d7377;
-    }
-    
-    QTreeWidget::item:hover {
-        background-color: #2d2d2d;
-    }
-    
-    /* Custom Header Frame */
-    QFrame[headerFrame="true"] {
-        background-color: #252525;
-        border-bottom: 1px solid #404040;
-    }
-    
-    /* Side Panel */
-    QFrame[sidePanel="true"] {
-        background-color: #252525;
-        border-radius: 8px;
-    }
-    
-    /* Main Panel */
-    QFrame[mainPanel="true"] {
-        background-color: #1e1e1e;
-        border-radius: 8px;
-    }
-    
-    /* Breadcrumb */
-    QLabel[labelStyle="breadcrumb"] {
-        font-size: 12px;
-        color: #0d7377;
-        background-color: #2d2d2d;
-        padding: 4px 8px;
-        border-radius: 4px;
-    }
-    
-    QTreeWidget::branch {
-        background-color: transparent;
-    }
-    
-    QTreeWidget::branch:hover {
-        background-color: #2d2d2d;
-    }
-    
-    /* Scroll Bar */
-    QScrollBar:vertical {
-        background-color: #2d2d2d;
-        width: 12px;
-        border-radius: 6px;
-    }
-    
-    QScrollBar::handle:vertical {
-        background-color: #505050;
-        border-radius: 6px;
-        min-height: 20px;
-        margin: 2px;
-    }
-    
-    QScrollBar::handle:vertical:hover {
-        background-color: #606060;
-    }
-    
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-        border: none;
-        background: none;
-    }
-    
-    QScrollBar:horizontal {
-        background-color: #2d2d2d;
-        height: 12px;
-        border-radius: 6px;
-    }
-    
-    QScrollBar::handle:horizontal {
-        background-color: #505050;
-        border-radius: 6px;
-        min-width: 20px;
-        margin: 2px;
-    }
-    
-    QScrollBar::handle:horizontal:hover {
-        background-color: #606060;
-    }
-    
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-        border: none;
-        background: none;
-    }
-    
-    /* Splitter */
-    QSplitter::handle {
-        background-color: #404040;
-    }
-    
-    QSplitter::handle:horizontal {
-        width: 2px;
-    }
-    
-    QSplitter::handle:vertical {
-        height: 2px;
-    }
-    
-    /* Status Bar */
-    QStatusBar {
-        background-color: #2d2d2d;
-        color: #b0b0b0;
-        border-top: 1px solid #404040;
-        padding: 4px;
-    }
-    
-    /* Tab Widget */
-    QTabWidget::pane {
-        background-color: #1e1e1e;
-        border: 1px solid #404040;
-        border-radius: 8px;
-    }
-    
-    QTabBar::tab {
-        background-color: #2d2d2d;
-        color: #b0b0b0;
-        padding: 8px 16px;
-        margin-right: 2px;
-        border-top-left-radius: 6px;
-        border-top-right-radius: 6px;
-    }
-    
-    QTabBar::tab:selected {
-        background-color: #0d7377;
-        color: #ffffff;
-    }
-    
-    QTabBar::tab:hover {
-        background-color: #404040;
-        color: #ffffff;
-    }
-    
-    /* Group Box */
-    QGroupBox {
-        font-weight: 600;
-        font-size: 14px;
-        color: #0d7377;
-        border: 2px solid #404040;
-        border-radius: 8px;
-        margin-top: 1ex;
-        padding-top: 10px;
-    }
-    
-    QGroupBox::title {
-        subcontrol-origin: margin;
-        left: 10px;
-        padding: 0 10px 0 10px;
-        background-color: #1e1e1e;
-    }
-    
-    /* Combo Box */
-    QComboBox {
-        background-color: #2d2d2d;
-        border: 2px solid #404040;
-        border-radius: 8px;
-        padding: 8px 12px;
-        color: #ffffff;
-        font-size: 14px;
-    }
-    
-    QComboBox:focus {
-        border-color: #0d7377;
-    }
-    
-    QComboBox::drop-down {
-        border: none;
-        width: 20px;
-    }
-    
-    QComboBox::down-arrow {
-        image: none;
-        border-left: 5px solid transparent;
-        border-right: 5px solid transparent;
-        border-top: 5px solid #b0b0b0;
-    }
-    
-    QComboBox QAbstractItemView {
-        background-color: #2d2d2d;
-        border: 1px solid #404040;
-        border-radius: 6px;
-        selection-background-color: #0d7377;
-    }
-    
-    /* Slider */
-    QSlider::groove:horizontal {
-        border: none;
-        height: 6px;
-        background-color: #404040;
-        border-radius: 3px;
-    }
-    
-    QSlider::handle:horizontal {
-        background-color: #0d7377;
-        border: none;
-        width: 18px;
-        height: 18px;
-        border-radius: 9px;
-        margin: -6px 0;
-    }
-    
-    QSlider::handle:horizontal:hover {
-        background-color: #14a085;
-    }
-    
-    QSlider::sub-page:horizontal {
-        background-color: #0d7377;
-        border-radius: 3px;
-    }
-    
-    /* Dialog */
-    QDialog {
-        background-color: #1e1e1e;
-        color: #ffffff;
-    }
-    
-    /* Progress Bar */
-    QProgressBar {
-        background-color: #2d2d2d;
-        border: none;
-        border-radius: 6px;
-        text-align: center;
-        font-weight: 600;
-    }
-    
-    QProgressBar::chunk {
-        background-color: #0d7377;
-        border-radius: 6px;
-    }
-    """
+    return _build_theme('dark')
+
 
 def get_light_theme_style():
     """Get light theme stylesheet - clean and modern"""
-    return """
-    QMainWindow {
-        background-color: #ffffff;
-        color: #333333;
-    }
-    
-    QWidget {
-        background-color: #ffffff;
-        color: #333333;
-        font-family: 'Segoe UI', Arial, sans-serif;
-    }
-    
-    /* Menu Bar */
-    QMenuBar {
-        background-color: #f5f5f5;
-        color: #333333;
-        border: none;
-        padding: 4px;
-    }
-    
-    QMenuBar::item {
-        background-color: transparent;
-        padding: 8px 12px;
-        border-radius: 4px;
-        margin: 2px;
-    }
-    
-    QMenuBar::item:selected {
-        background-color: #e0e0e0;
-    }
-    
-    QMenuBar::item:pressed {
-        background-color: #d0d0d0;
-    }
-    
-    QMenu {
-        background-color: #ffffff;
-        color: #333333;
-        border: 1px solid #e0e0e0;
-        border-radius: 6px;
-        padding: 4px;
-    }
-    
-    QMenu::item {
-        padding: 8px 20px;
-        border-radius: 4px;
-        margin: 1px;
-    }
-    
-    QMenu::item:selected {
-        background-color: #0d7377;
-        color: #ffffff;
-    }
-    
-    /* Tool Bar */
-    QToolBar {
-        background-color: #f5f5f5;
-        border: none;
-        spacing: 6px;
-        padding: 8px;
-    }
-    
-    QToolButton {
-        background-color: transparent;
-        border: none;
-        border-radius: 6px;
-        padding: 8px 12px;
-        color: #333333;
-        font-weight: 500;
-    }
-    
-    QToolButton:hover {
-        background-color: #e0e0e0;
-    }
-    
-    QToolButton:pressed {
-        background-color: #d0d0d0;
-    }
-    
-    QToolButton:checked {
-        background-color: #0d7377;
-        color: #ffffff;
-    }
-    
-    /* Buttons */
-    QPushButton {
-        background-color: #0d7377;
-        color: #ffffff;
-        border: none;
-        border-radius: 8px;
-        padding: 10px 20px;
-        font-weight: 600;
-        font-size: 14px;
-    }
-    
-    QPushButton:hover {
-        background-color: #14a085;
-    }
-    
-    QPushButton:pressed {
-        background-color: #0a5d61;
-    }
-    
-    QPushButton:disabled {
-        background-color: #e0e0e0;
-        color: #808080;
-    }
-    
-    /* Secondary Button */
-    QPushButton[buttonStyle="secondary"] {
-        background-color: #e0e0e0;
-        color: #333333;
-    }
-    
-    QPushButton[buttonStyle="secondary"]:hover {
-        background-color: #d0d0d0;
-    }
-    
-    /* Line Edit */
-    QLineEdit {
-        background-color: #ffffff;
-        border: 2px solid #e0e0e0;
-        border-radius: 8px;
-        padding: 8px 12px;
-        color: #333333;
-        font-size: 14px;
-    }
-    
-    QLineEdit:focus {
-        border-color: #0d7377;
-    }
-    
-    /* Labels */
-    QLabel {
-        color: #333333;
-        font-size: 14px;
-    }
-    
-    QLabel[labelStyle="heading"] {
-        font-size: 18px;
-        font-weight: bold;
-        color: #0d7377;
-    }
-    
-    QLabel[labelStyle="subheading"] {
-        font-size: 16px;
-        font-weight: 600;
-        color: #333333;
-    }
-    
-    QLabel[labelStyle="caption"] {
-        font-size: 12px;
-        color: #808080;
-    }
-    
-    /* List Widget */
-    QListWidget {
-        background-color: #ffffff;
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        padding: 4px;
-        outline: none;
-    }
-    
-    QListWidget::item {
-        border-radius: 6px;
-        padding: 8px;
-        margin: 2px;
-    }
-    
-    QListWidget::item:selected {
-        background-color: #0d7377;
-        color: #ffffff;
-    }
-    
-    QListWidget::item:hover {
-        background-color: #f0f0f0;
-    }
-    
-    /* Tree Widget */
-    QTreeWidget {
-        background-color: #ffffff;
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        outline: none;
-        alternate-background-color: #f8f8f8;
-    }
-    
-    QTreeWidget::item {
-        padding: 6px;
-        border-radius: 4px;
-        margin: 1px;
-    }
-    
-    QTreeWidget::item:selected {
-        background-color: #0d7377;
-        color: #ffffff;
-    }
-    
-    QTreeWidget::item:hover {
-        background-color: #f0f0f0;
-    }
-    
-    /* Custom Header Frame */
-    QFrame[headerFrame="true"] {
-        background-color: #f0f0f0;
-        border-bottom: 1px solid #e0e0e0;
-    }
-    
-    /* Side Panel */
-    QFrame[sidePanel="true"] {
-        background-color: #f8f8f8;
-        border-radius: 8px;
-    }
-    
-    /* Main Panel */
-    QFrame[mainPanel="true"] {
-        background-color: #ffffff;
-        border-radius: 8px;
-    }
-    
-    /* Breadcrumb */
-    QLabel[labelStyle="breadcrumb"] {
-        font-size: 12px;
-        color: #0d7377;
-        background-color: #f0f0f0;
-        padding: 4px 8px;
-        border-radius: 4px;
-    }
-    
-    /* Scroll Bar */
-    QScrollBar:vertical {
-        background-color: #f5f5f5;
-        width: 12px;
-        border-radius: 6px;
-    }
-    
-    QScrollBar::handle:vertical {
-        background-color: #c0c0c0;
-        border-radius: 6px;
-        min-height: 20px;
-        margin: 2px;
-    }
-    
-    QScrollBar::handle:vertical:hover {
-        background-color: #a0a0a0;
-    }
-    
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-        border: none;
-        background: none;
-    }
-    
-    QScrollBar:horizontal {
-        background-color: #f5f5f5;
-        height: 12px;
-        border-radius: 6px;
-    }
-    
-    QScrollBar::handle:horizontal {
-        background-color: #c0c0c0;
-        border-radius: 6px;
-        min-width: 20px;
-        margin: 2px;
-    }
-    
-    QScrollBar::handle:horizontal:hover {
-        background-color: #a0a0a0;
-    }
-    
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-        border: none;
-        background: none;
-    }
-    
-    /* Status Bar */
-    QStatusBar {
-        background-color: #f5f5f5;
-        color: #808080;
-        border-top: 1px solid #e0e0e0;
-        padding: 4px;
-    }
-    """
+    return _build_theme('light')
+
+
+@lru_cache(maxsize=1)
+def _load_template():
+    """Read the stylesheet template from disk on first use"""
+    with open(_QSS_TEMPLATE_PATH, encoding='utf-8') as qss_file:
+        return Template(qss_file.read())
+
+
+@lru_cache(maxsize=2)
+def _build_theme(name):
+    """Build the stylesheet for a theme once, on first request"""
+    palette = _THEME_PALETTES.get(name, _DARK_PALETTE)
+    return _minify_qss(_load_template().substitute(palette))
+
+
+@lru_cache(maxsize=2)
+def _build_palette(name):
+    """Build the QPalette matching a theme's stylesheet colors"""
+    colors = _THEME_PALETTES.get(name, _DARK_PALETTE)
+    palette = QPalette()
+    roles = (
+        (QPalette.Window, 'bg'),
+        (QPalette.WindowText, 'text'),
+        (QPalette.Base, 'input_bg'),
+        (QPalette.AlternateBase, 'panel_bg'),
+        (QPalette.Text, 'text'),
+        (QPalette.Button, 'surface'),
+        (QPalette.ButtonText, 'text'),
+        (QPalette.ToolTipBase, 'surface'),
+        (QPalette.ToolTipText, 'text'),
+        (QPalette.Highlight, 'accent'),
+        (QPalette.HighlightedText, 'accent_text'),
+        (QPalette.Link, 'accent'),
+    )
+    for role, key in roles:
+        palette.setColor(role, QColor(colors[key]))
+    
+    disabled = QColor(colors['disabled_text'])
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        palette.setColor(QPalette.Disabled, role, disabled)
+    return palette
+
+
+def _minify_qss(sheet):
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    sheet = _QSS_COMMENT_RE.sub("", sheet)
+    sheet = _QSS_SPACE_RE.sub(" ", sheet)
+    return _QSS_PUNCT_RE.sub(r"\1", sheet).strip()
+
 
 def apply_theme(app, theme='dark'):
     """Apply theme to application"""
-    if theme == 'dark':
-        app.setStyleSheet(get_dark_theme_style())
-    else:
-        app.setStyleSheet(get_light_theme_style())
\ No newline at end of file
+    sheet = _build_theme(theme)
+    
+    # Re-setting an identical sheet still makes Qt re-parse it and re-polish
+    # every widget, so compare against what was applied last rather than the
+    # theme name (unknown names resolve to the same sheet as 'dark')
+    if getattr(app, '_applied_style_sheet', None) == sheet:
+        return
+    
+    # The palette covers whatever the sheet doesn't reach (native dialogs,
+    # tooltips, custom-painted widgets), so QWidget stays the only catch-all rule
+    app.setPalette(_build_palette(theme))
+    
+    # setStyleSheet() only takes a QString, so the cached str is handed over
+    # as is; the conversion is paid once per real theme change. The whole
+    # sheet goes on the app on purpose: dialogs and the video player create
+    # widget types after startup, and Qt already buckets rules by type name,
+    # so selectors for widgets not on screen cost next to nothing per polish
+    app.setStyleSheet(sheet)
+    app._applied_style_sheet = sheet
@@ -7,12 +7,148 @@ Optimized for handling thousands of photos efficiently
 """
 
 import os
+import sys
+import queue
 import hashlib
+import threading
+from collections import deque
+from functools import lru_cache
 from typing import Optional, Tuple
-from PyQt5.QtCore import QObject, pyqtSignal, QMutex, QMutexLocker, QSize, QTimer
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QBrush, QColor
+from PyQt5.QtCore import (QObject, pyqtSignal, QMutex, QMutexLocker, QSize, QTimer,
+                          QRunnable, QThreadPool, QPoint)
+from PyQt5.QtGui import (QPixmap, QPixmapCache, QImage, QPainter,
+                         QBrush, QColor, QPolygon)
 from PyQt5.QtCore import Qt
-from PIL import Image, ImageOps
+from PIL import Image
+
+from .async_image_loader import read_scaled_image
+
+try:
+    import pyvips  # Optional: SIMD decode + resize when libvips is installed
+except (ImportError, OSError):
+    pyvips = None
+
+# EXIF orientation -> transpose that puts the image upright (as in exif_transpose)
+_EXIF_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+# PIL raw mode whose bytes match Qt's 0xAARRGGBB pixels in native byte order
+_QT_ARGB32_RAW = 'BGRA' if sys.byteorder == 'little' else 'ARGB'
+
+# Below this tile size antialiasing the placeholder icons isn't visible
+SMOOTH_TILE_SIZE = 160
+
+# Source files per batch request whose reads are started ahead of decoding
+PREFETCH_LIMIT = 64
+
+
+@lru_cache(maxsize=64)
+def _corner_mask(width: int, height: int, radius: int) -> QImage:
+    """Get an opaque rounded-rect mask, rasterised once per thumbnail shape"""
+    mask = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    mask.fill(Qt.transparent)
+    
+    painter = QPainter(mask)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(Qt.black)
+    painter.drawRoundedRect(mask.rect(), radius, radius)
+    painter.end()
+    return mask
+
+
+@lru_cache(maxsize=16)
+def _triangle_for_size(size: int) -> QPolygon:
+    """Get the play button triangle centred in a tile of the given size"""
+    half = size // 3 // 2
+    center = size // 2
+    return QPolygon([
+        QPoint(center - half, center - half),
+        QPoint(center + half, center),
+        QPoint(center - half, center + half)
+    ])
+
+
+class _ThumbnailTask(QRunnable):
+    """Load one thumbnail from the disk cache or decode it, off the GUI thread"""
+    
+    def __init__(self, generator, file_path: str, size: int, use_cache: bool, is_image: bool,
+                 cache_path: Optional[str] = None):
+        super().__init__()
+        self.generator = generator
+        self.file_path = file_path
+        self.size = size
+        self.use_cache = use_cache
+        self.is_image = is_image
+        self.cache_path = cache_path  # Already derived by a prefetch, if any
+    
+    def run(self):
+        """Produce a QImage and post it back to the generator's thread"""
+        generator = self.generator
+        image, write_path, error = None, "", ""
+        try:
+            # Derive the cache file name once for both lookup and write
+            cache_path = ""
+            if self.use_cache:
+                cache_path = self.cache_path
+                if cache_path is None:
+                    cache_path = generator._get_cache_path(self.file_path, self.size)
+            if cache_path:
+                image = generator._get_cached_thumbnail(cache_path)
+            if image is None and self.is_image:
+                image = generator._generate_image_thumbnail(self.file_path, self.size)
+                write_path = cache_path
+        except Exception as e:
+            error = str(e)
+        generator.image_loaded.emit(self.file_path, self.size, write_path, image, error)
+
+
+class _PrefetchTask(QRunnable):
+    """Start kernel readahead for images that will be decoded soon"""
+    
+    def __init__(self, generator, file_paths: list, size: int, use_cache: bool):
+        super().__init__()
+        self.generator = generator
+        self.file_paths = file_paths
+        self.size = size
+        self.use_cache = use_cache
+    
+    def run(self):
+        """Advise WILLNEED on each file that has no disk-cached thumbnail"""
+        generator = self.generator
+        for file_path in self.file_paths:
+            with QMutexLocker(generator.mutex):
+                # Decodes that already started derive their own cache path
+                if file_path not in generator.queued_paths:
+                    continue
+            
+            if self.use_cache:
+                cache_path = generator._get_cache_path(file_path, self.size)
+                with QMutexLocker(generator.mutex):
+                    # Only hand the path over if the request is still queued;
+                    # _dispatch takes it out again whichever way it is served
+                    if file_path not in generator.queued_paths:
+                        continue
+                    generator.prefetched_cache_paths[file_path] = (self.size, cache_path)
+                if cache_path and os.path.exists(cache_path):
+                    continue
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
 
 
 class ThumbnailGenerator(QObject):
@@ -22,26 +158,43 @@ class ThumbnailGenerator(QObject):
     thumbnail_ready = pyqtSignal(str, QPixmap)  # file_path, thumbnail
     generation_progress = pyqtSignal(int, int)  # current, total
     error_occurred = pyqtSignal(str, str)  # error message, file path
+    # file_path, size, cache path to write or "", QImage or None, error text
+    image_loaded = pyqtSignal(str, int, str, object, str)
     
     def __init__(self, config, parent=None):
         super().__init__(parent)
         self.config = config
         self.mutex = QMutex()
-        self.request_queue = []
+        self.request_queue = deque()  # Queued file paths
+        self.queued_paths = set()  # Paths in request_queue, for O(1) de-duplication
+        self.request_size = config.get_thumbnail_size()  # Size for every queued path
         self.should_stop = False
         self.cache_dir = config.get_cache_dir()
-        self.thumbnail_cache = {}
-        self.processing = False
+        self.video_placeholders = {}  # size -> QPixmap without the file name
+        self.prefetched_cache_paths = {}  # Queued file_path -> (size, cache path) from a prefetch
+        self.in_flight = 0  # Requests handed to the decode pool
         self.max_batch_size = 20  # Increase batch size for better performance
         self.debug_mode = False  # Disable debug logging for better performance
         
         # Ensure cache directory exists
         os.makedirs(self.cache_dir, exist_ok=True)
         
-        # Use timer for processing requests with optimized interval
-        self.process_timer = QTimer(parent)
-        self.process_timer.timeout.connect(self._process_next_batch)
-        self.process_timer.setInterval(50)  # Process every 50ms for better responsiveness
+        # Recent thumbnails live in Qt's shared pixmap cache (an LRU sized in
+        # KB); raise its 10MB default so scrolling back avoids the disk
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 128 * 1024))
+        
+        # Decoders release the GIL, so images are decoded in parallel. A pool
+        # of our own keeps long runs from starving other QThreadPool users
+        self.decode_pool = QThreadPool(self)
+        self.decode_pool.setMaxThreadCount(min(self.max_batch_size, os.cpu_count() or 1))
+        self.max_in_flight = self.decode_pool.maxThreadCount() * 2
+        self.image_loaded.connect(self._on_image_loaded, Qt.QueuedConnection)
+        
+        # PNG encoding and disk writes happen off the GUI thread
+        self.write_queue = queue.Queue()
+        self.cache_writer = threading.Thread(
+            target=self._write_cache_files, name="ThumbnailCacheWriter", daemon=True)
+        self.cache_writer.start()
     
     def request_thumbnail(self, file_path: str, size: int = None):
         """Request thumbnail generation for a file"""
@@ -49,208 +202,291 @@ class ThumbnailGenerator(QObject):
             size = self.config.get_thumbnail_size()
         
         with QMutexLocker(self.mutex):
-            if file_path not in [req[0] for req in self.request_queue]:
-                self.request_queue.append((file_path, size))
+            # Queued paths are generated at the latest requested size; the
+            # gallery re-requests everything when its thumbnail size changes
+            self.request_size = size
+            if file_path not in self.queued_paths:
+                self.queued_paths.add(file_path)
+                self.request_queue.append(file_path)
         
-        # Start processing if not already running
-        if not self.process_timer.isActive():
-            self.process_timer.start()
+        self._dispatch()
     
     def request_thumbnails_batch(self, file_paths: list, size: int = None):
         """Request thumbnails for multiple files"""
         if size is None:
             size = self.config.get_thumbnail_size()
         
+        new_paths = []
         with QMutexLocker(self.mutex):
+            self.request_size = size
+            queued_paths = self.queued_paths
             for file_path in file_paths:
-                if file_path not in [req[0] for req in self.request_queue]:
-                    self.request_queue.append((file_path, size))
+                if file_path not in queued_paths:
+                    queued_paths.add(file_path)
+                    self.request_queue.append(file_path)
+                    new_paths.append(file_path)
         
-        # Start processing if not already running
-        if not self.process_timer.isActive():
-            self.process_timer.start()
+        self._dispatch()
+        self._prefetch(new_paths, size)
+    
+    def _prefetch(self, file_paths: list, size: int):
+        """Have the kernel read upcoming source images while others decode
+        
+        Runs after _dispatch, so only paths still waiting in the queue are
+        read ahead; those already handed to the decode pool are being read.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        
+        with QMutexLocker(self.mutex):
+            waiting = [file_path for file_path in file_paths
+                       if file_path in self.queued_paths]
+        
+        prefetch = []
+        for file_path in waiting:
+            if len(prefetch) >= PREFETCH_LIMIT:
+                break
+            if self._is_image_file(file_path) and self._mem_get(file_path, size) is None:
+                prefetch.append(file_path)
+        
+        # The global pool, so readahead isn't queued behind the decodes
+        if prefetch:
+            QThreadPool.globalInstance().start(
+                _PrefetchTask(self, prefetch, size, self.config.is_cache_enabled()))
     
     def stop_generation(self):
         """Stop thumbnail generation"""
-        self.process_timer.stop()
         with QMutexLocker(self.mutex):
             self.should_stop = True
             self.request_queue.clear()
+            self.queued_paths.clear()
+            self.prefetched_cache_paths.clear()
     
     def clear_queue(self):
         """Clear the request queue"""
         with QMutexLocker(self.mutex):
             self.request_queue.clear()
+            self.queued_paths.clear()
+            self.prefetched_cache_paths.clear()
     
-    def _process_next_batch(self):
-        """Process a batch of thumbnail requests"""
-        if self.processing:
-            return
-            
-        with QMutexLocker(self.mutex):
-            if self.should_stop or not self.request_queue:
-                self.process_timer.stop()
-                return
+    def _dispatch(self):
+        """Start queued requests, serving memory hits and video tiles inline"""
+        served = 0
+        while served < self.max_batch_size and self.in_flight < self.max_in_flight:
+            with QMutexLocker(self.mutex):
+                if self.should_stop or not self.request_queue:
+                    break
+                file_path = self.request_queue.popleft()
+                size = self.request_size
+                self.queued_paths.discard(file_path)
+                prefetched = self.prefetched_cache_paths.pop(file_path, None)
+            
+            served += 1
+            try:
+                # Thumbnails scrolled back into view skip disk entirely
+                thumbnail = self._mem_get(file_path, size)
+                if thumbnail is not None:
+                    self.thumbnail_ready.emit(file_path, thumbnail)
+                    continue
+                
+                # Video tiles are cheaper to draw than to read back from disk
+                if self._is_video_file(file_path):
+                    self._emit_thumbnail(
+                        file_path, size, self._generate_video_thumbnail(file_path, size))
+                    continue
                 
-            # Process a batch of requests at once
-            batch_size = min(self.max_batch_size, len(self.request_queue))
-            batch = self.request_queue[:batch_size]
-            self.request_queue = self.request_queue[batch_size:]
-            total_requests = len(self.request_queue)
+                # A path derived for another size would name the wrong file
+                cache_path = prefetched[1] if prefetched and prefetched[0] == size else None
+                self.in_flight += 1
+                self.decode_pool.start(_ThumbnailTask(
+                    self, file_path, size, self.config.is_cache_enabled(),
+                    self._is_image_file(file_path), cache_path))
+                    
+            except Exception as e:
+                if self.debug_mode:
+                    print(f"Error processing thumbnail: {e}")
+                self.error_occurred.emit(f"Thumbnail generation failed: {str(e)}", file_path)
         
-        self.processing = True
+        if not served:
+            return
+        
+        # Emit progress once per round, and only if something is listening
+        if self.receivers(self.generation_progress):
+            remaining = len(self.request_queue)
+            self.generation_progress.emit(remaining, remaining + served)
+        
+        # Yield to the event loop between rounds of inline work; when the pool
+        # is full instead, finished decodes pull in the next requests
+        if served == self.max_batch_size and self.in_flight < self.max_in_flight:
+            QTimer.singleShot(0, self._dispatch)
+    
+    def _on_image_loaded(self, file_path: str, size: int, write_path: str,
+                         image: Optional[QImage], error: str):
+        """Turn a decoded image into a pixmap on the GUI thread and emit it"""
+        self.in_flight -= 1
+        if not self.should_stop:
+            if error:
+                if self.debug_mode:
+                    print(f"Thumbnail generation error for {file_path}: {error}")
+                self.thumbnail_ready.emit(file_path, self._create_error_thumbnail(
+                    size, f"Error: {error[:20]}..."))
+            else:
+                # QPixmap may only be created on the GUI thread
+                thumbnail = QPixmap.fromImage(image) if image is not None else None
+                if thumbnail and write_path:
+                    self._cache_thumbnail(write_path, image)
+                self._emit_thumbnail(file_path, size, thumbnail)
         
+        self._dispatch()
+    
+    def _mem_get(self, file_path: str, size: int) -> Optional[QPixmap]:
+        """Get a thumbnail from the shared in-memory pixmap cache"""
+        pixmap = QPixmapCache.find(f"thumb:{size}:{file_path}")
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+    
+    def _mem_put(self, file_path: str, size: int, thumbnail: QPixmap):
+        """Add a thumbnail to the shared in-memory pixmap cache"""
+        QPixmapCache.insert(f"thumb:{size}:{file_path}", thumbnail)
+    
+    def _emit_thumbnail(self, file_path: str, size: int, thumbnail: Optional[QPixmap]):
+        """Emit a finished thumbnail, or an error placeholder if there is none"""
+        if thumbnail and not thumbnail.isNull():
+            # Error placeholders are not kept, so failures are retried later
+            self._mem_put(file_path, size, thumbnail)
+            self.thumbnail_ready.emit(file_path, thumbnail)
+        else:
+            if self.debug_mode:
+                print(f"Failed to generate thumbnail for {file_path}")
+            # Generate error placeholder
+            error_thumb = self._create_error_thumbnail(size, "加载失败")
+            self.thumbnail_ready.emit(file_path, error_thumb)
+    
+    def _is_image_file(self, file_path: str) -> bool:
+        """Check if a file has one of the supported image extensions"""
+        _, ext = os.path.splitext(file_path.lower())
+        return ext in self.config.get_supported_formats()
+    
+    def _is_video_file(self, file_path: str) -> bool:
+        """Check if a file has one of the supported video extensions"""
+        _, ext = os.path.splitext(file_path.lower())
+        return ext in self.config.get_video_formats()
+    
+    def _generate_image_thumbnail(self, file_path: str, size: int) -> Optional[QImage]:
+        """Generate thumbnail for image files with optimized approach
+        
+        Runs on the decode pool, so it only touches QImage, never QPixmap.
+        """
+        # Check if file exists and is readable
+        if not os.path.exists(file_path) or not os.access(file_path, os.R_OK):
+            if self.debug_mode:
+                print(f"File not found or not readable: {file_path}")
+            return None
+        
+        # libvips shrinks while decoding and applies EXIF orientation in one pass
+        if pyvips is not None:
+            image = self._generate_vips_thumbnail(file_path, size)
+            if image is not None:
+                return self._add_rounded_corners(image, 8)
+        
+        # Thumbnails fill their tile, so small images are scaled up too
+        image = read_scaled_image(file_path, size, enlarge=True)
+        if not image.isNull():
+            # Add rounded corners
+            return self._add_rounded_corners(image, 8)
+        
+        # If Qt failed, try PIL as a fallback with optimizations
         try:
-            # Process the batch
-            for file_path, size in batch:
+            with Image.open(file_path) as image:
+                # Let libjpeg downscale by 1/2-1/8 while decoding
+                # instead of producing every full-resolution pixel
+                if image.format in ('JPEG', 'MPO'):
+                    image.draft('RGB', (size, size))
+                
+                # Handle EXIF orientation; only the tag is read here, the
+                # rotation is applied to the small thumbnail after resizing
                 try:
-                    # Check cache first
-                    thumbnail = self._get_cached_thumbnail(file_path, size)
-                    
-                    if thumbnail is None:
-                        # Generate new thumbnail
-                        thumbnail = self._generate_thumbnail(file_path, size)
-                        
-                        if thumbnail and self.config.is_cache_enabled():
-                            self._cache_thumbnail(file_path, thumbnail, size)
-                    
-                    if thumbnail and not thumbnail.isNull():
-                        self.thumbnail_ready.emit(file_path, thumbnail)
-                    else:
-                        if self.debug_mode:
-                            print(f"Failed to generate thumbnail for {file_path}")
-                        # Generate error placeholder
-                        error_thumb = self._create_error_thumbnail(size, "加载失败")
-                        self.thumbnail_ready.emit(file_path, error_thumb)
-                        
+                    orientation = image.getexif().get(0x0112, 1)
                 except Exception as e:
                     if self.debug_mode:
-                        print(f"Error processing thumbnail: {e}")
-                    self.error_occurred.emit(f"Thumbnail generation failed: {str(e)}", file_path)
-            
-            # Emit progress
-            self.generation_progress.emit(total_requests, total_requests + batch_size)
-            
-        finally:
-            self.processing = False
-            
-            # Continue processing if there are more requests
-            with QMutexLocker(self.mutex):
-                if self.request_queue and not self.should_stop:
-                    # Continue processing
-                    pass
+                        print(f"EXIF read error: {e}")
+                    orientation = 1
+                
+                # Convert to RGB if necessary (only when needed)
+                if image.mode not in ('RGB', 'RGBA'):
+                    image = image.convert('RGB')
+                
+                # Calculate thumbnail size maintaining aspect ratio
+                img_width, img_height = image.size
+                aspect_ratio = img_width / img_height
+                
+                if aspect_ratio > 1:
+                    # Landscape
+                    thumb_width = size
+                    thumb_height = int(size / aspect_ratio)
                 else:
-                    self.process_timer.stop()
-    
-    def _generate_thumbnail(self, file_path: str, size: int) -> Optional[QPixmap]:
-        """Generate thumbnail for image file"""
-        try:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                return None
-            
-            # Get file extension
-            _, ext = os.path.splitext(file_path.lower())
-            
-            # Handle different file types
-            if ext in self.config.get_supported_formats():
-                return self._generate_image_thumbnail(file_path, size)
-            elif ext in self.config.get_video_formats():
-                return self._generate_video_thumbnail(file_path, size)
-            
-            return None
-            
-        except Exception as e:
-            self.error_occurred.emit(f"Failed to generate thumbnail: {str(e)}", file_path)
+                    # Portrait
+                    thumb_width = int(size * aspect_ratio)
+                    thumb_height = size
+                
+                # Use faster resampling for better performance
+                # LANCZOS is high quality but slower, BILINEAR is faster
+                thumbnail = image.resize((thumb_width, thumb_height), Image.Resampling.BILINEAR)
+                
+                transpose = _EXIF_TRANSPOSE.get(orientation)
+                if transpose is not None:
+                    thumbnail = thumbnail.transpose(transpose)
+                    thumb_width, thumb_height = thumbnail.size
+                
+                # Hand Qt 32-bit pixels in its own layout so neither the
+                # rounding pass nor QPixmap.fromImage has to re-pack them.
+                # Opaque images get alpha 0xff from the RGBA padding, which
+                # makes them valid premultiplied pixels as they are.
+                if thumbnail.mode == 'RGBA':
+                    fmt = QImage.Format_ARGB32
+                else:
+                    thumbnail = thumbnail.convert('RGBA')
+                    fmt = QImage.Format_ARGB32_Premultiplied
+                
+                # `data` must outlive qimage
+                data = thumbnail.tobytes('raw', _QT_ARGB32_RAW)
+                qimage = QImage(data, thumb_width, thumb_height, thumb_width * 4, fmt)
+                
+                if qimage.isNull():
+                    if self.debug_mode:
+                        print(f"Created null QImage for {file_path}")
+                    return None
+                    
+                # Painting into read-only `data` detaches qimage to a Qt-owned copy
+                return self._add_rounded_corners(qimage, 8)
+        except Exception as pil_error:
+            if self.debug_mode:
+                print(f"PIL processing error for {file_path}: {pil_error}")
             return None
     
-    def _generate_image_thumbnail(self, file_path: str, size: int) -> Optional[QPixmap]:
-        """Generate thumbnail for image files with optimized approach"""
+    def _generate_vips_thumbnail(self, file_path: str, size: int) -> Optional[QImage]:
+        """Generate thumbnail with libvips, or None to fall back to Qt/PIL"""
         try:
-            # Check if file exists and is readable
-            if not os.path.exists(file_path) or not os.access(file_path, os.R_OK):
-                if self.debug_mode:
-                    print(f"File not found or not readable: {file_path}")
+            image = pyvips.Image.thumbnail(file_path, size, height=size)
+            if image.interpretation != 'srgb':
+                image = image.colourspace('srgb')
+            if image.format != 'uchar':
+                image = image.cast('uchar')
+            if image.bands not in (3, 4):
                 return None
             
-            # Direct QPixmap loading - simplest and fastest approach for standard formats
-            pixmap = QPixmap(file_path)
-            if not pixmap.isNull():
-                # Scale to thumbnail size with optimized transformation
-                scaled = pixmap.scaled(
-                    size, size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                # Add rounded corners
-                return self._add_rounded_corners(scaled, 8)
+            fmt = QImage.Format_RGBA8888 if image.bands == 4 else QImage.Format_RGB888
+            data = image.write_to_memory()
+            qimage = QImage(data, image.width, image.height,
+                            image.width * image.bands, fmt)
             
-            # If QPixmap failed, try PIL as a fallback with optimizations
-            try:
-                with Image.open(file_path) as image:
-                    # Handle EXIF orientation
-                    try:
-                        image = ImageOps.exif_transpose(image)
-                    except Exception as e:
-                        if self.debug_mode:
-                            print(f"EXIF transpose error: {e}")
-                    
-                    # Convert to RGB if necessary (only when needed)
-                    if image.mode not in ('RGB', 'RGBA'):
-                        image = image.convert('RGB')
-                    
-                    # Calculate thumbnail size maintaining aspect ratio
-                    img_width, img_height = image.size
-                    aspect_ratio = img_width / img_height
-                    
-                    if aspect_ratio > 1:
-                        # Landscape
-                        thumb_width = size
-                        thumb_height = int(size / aspect_ratio)
-                    else:
-                        # Portrait
-                        thumb_width = int(size * aspect_ratio)
-                        thumb_height = size
-                    
-                    # Use faster resampling for better performance
-                    # LANCZOS is high quality but slower, BILINEAR is faster
-                    thumbnail = image.resize((thumb_width, thumb_height), Image.Resampling.BILINEAR)
-                    
-                    # Convert PIL image to QPixmap more efficiently
-                    if thumbnail.mode == 'RGB':
-                        # Use more efficient conversion
-                        qimage = QImage(thumbnail.tobytes(), thumb_width, thumb_height, QImage.Format.Format_RGB888)
-                    elif thumbnail.mode == 'RGBA':
-                        qimage = QImage(thumbnail.tobytes(), thumb_width, thumb_height, QImage.Format.Format_RGBA8888)
-                    else:
-                        # Fallback conversion
-                        thumbnail = thumbnail.convert('RGB')
-                        qimage = QImage(thumbnail.tobytes(), thumb_width, thumb_height, QImage.Format.Format_RGB888)
-                    
-                    # Create pixmap
-                    if qimage.isNull():
-                        if self.debug_mode:
-                            print(f"Created null QImage for {file_path}")
-                        return None
-                        
-                    pixmap = QPixmap.fromImage(qimage)
-                    if pixmap.isNull():
-                        if self.debug_mode:
-                            print(f"Created null QPixmap for {file_path}")
-                        return None
-                        
-                    # Return pixmap with rounded corners
-                    return self._add_rounded_corners(pixmap, 8)
-            except Exception as pil_error:
-                if self.debug_mode:
-                    print(f"PIL processing error for {file_path}: {pil_error}")
-                return None
-                
-        except Exception as e:
+            # Detach from the vips buffer before it goes away
+            return None if qimage.isNull() else qimage.copy()
+        except pyvips.Error as e:
             if self.debug_mode:
-                print(f"Thumbnail generation error for {file_path}: {e}")
-            # Create error placeholder
-            return self._create_error_thumbnail(size, f"Error: {str(e)[:20]}...")
+                print(f"libvips processing error for {file_path}: {e}")
+            return None
     
     def _generate_video_thumbnail(self, file_path: str, size: int) -> Optional[QPixmap]:
         """Generate thumbnail for video files (placeholder for now)"""
@@ -265,32 +501,18 @@ class ThumbnailGenerator(QObject):
     def _create_video_placeholder(self, size: int, filename: str) -> QPixmap:
         """Create a placeholder thumbnail for video files"""
         try:
-            pixmap = QPixmap(size, size)
-            pixmap.fill(QColor(45, 45, 45))
+            # Background and play icon are the same for every video of a size
+            base = self.video_placeholders.get(size)
+            if base is None:
+                base = self._create_video_placeholder_base(size)
+                self.video_placeholders[size] = base
             
+            pixmap = base.copy()
             painter = QPainter(pixmap)
             if not painter.isActive():
                 return pixmap
                 
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            # Draw video icon (triangle play button)
-            painter.setBrush(QBrush(QColor(13, 115, 119)))
-            painter.setPen(Qt.NoPen)
-            
-            # Draw play triangle
-            triangle_size = size // 3
-            center_x, center_y = size // 2, size // 2
-            
-            from PyQt5.QtGui import QPolygon
-            from PyQt5.QtCore import QPoint
-            
-            triangle = QPolygon([
-                QPoint(center_x - triangle_size // 2, center_y - triangle_size // 2),
-                QPoint(center_x + triangle_size // 2, center_y),
-                QPoint(center_x - triangle_size // 2, center_y + triangle_size // 2)
-            ])
-            painter.drawPolygon(triangle)
+            painter.setRenderHint(QPainter.Antialiasing, size >= SMOOTH_TILE_SIZE)
             
             # Draw filename
             painter.setPen(QColor(255, 255, 255))
@@ -307,7 +529,7 @@ class ThumbnailGenerator(QObject):
             if painter.isActive():
                 painter.end()
             
-            return self._add_rounded_corners(pixmap, 8)
+            return pixmap
         except Exception as e:
             print(f"Warning: Failed to create video placeholder: {e}")
             # Return simple colored rectangle as fallback
@@ -315,17 +537,52 @@ class ThumbnailGenerator(QObject):
             fallback.fill(QColor(45, 45, 45))
             return fallback
     
+    def _create_video_placeholder_base(self, size: int) -> QPixmap:
+        """Paint the background and play icon shared by all video placeholders"""
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        if not painter.isActive():
+            return pixmap
+            
+        # Paint the background with its rounded corners directly; the
+        # corners stay smooth at every size
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(45, 45, 45))
+        painter.drawRoundedRect(pixmap.rect(), 8, 8)
+        painter.setRenderHint(QPainter.Antialiasing, size >= SMOOTH_TILE_SIZE)
+        
+        # Draw video icon (triangle play button)
+        painter.setBrush(QBrush(QColor(13, 115, 119)))
+        painter.setPen(Qt.NoPen)
+        
+        # Draw play triangle
+        painter.drawPolygon(_triangle_for_size(size))
+        
+        if painter.isActive():
+            painter.end()
+        
+        return pixmap
+    
     def _create_error_thumbnail(self, size: int, error_text: str) -> QPixmap:
         """Create an error placeholder thumbnail"""
         try:
             pixmap = QPixmap(size, size)
-            pixmap.fill(QColor(60, 60, 60))
+            pixmap.fill(Qt.transparent)
             
             painter = QPainter(pixmap)
             if not painter.isActive():
                 return pixmap
                 
+            # Paint the background with its rounded corners directly; the
+            # corners stay smooth at every size
             painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(60, 60, 60))
+            painter.drawRoundedRect(pixmap.rect(), 8, 8)
+            painter.setRenderHint(QPainter.Antialiasing, size >= SMOOTH_TILE_SIZE)
             
             # Draw error icon (X)
             painter.setPen(QColor(200, 100, 100))
@@ -350,7 +607,7 @@ class ThumbnailGenerator(QObject):
             if painter.isActive():
                 painter.end()
             
-            return self._add_rounded_corners(pixmap, 8)
+            return pixmap
         except Exception as e:
             print(f"Warning: Failed to create error thumbnail: {e}")
             # Return simple colored rectangle as fallback
@@ -358,97 +615,120 @@ class ThumbnailGenerator(QObject):
             fallback.fill(QColor(60, 60, 60))
             return fallback
     
-    def _add_rounded_corners(self, pixmap: QPixmap, radius: int) -> QPixmap:
-        """Add rounded corners to pixmap"""
+    def _add_rounded_corners(self, image: QImage, radius: int) -> QImage:
+        """Round the corners of image in place (safe to call off the GUI thread)"""
         try:
-            if pixmap.isNull():
-                return pixmap
-                
-            rounded = QPixmap(pixmap.size())
-            rounded.fill(Qt.transparent)
+            if image.isNull():
+                return image
             
-            painter = QPainter(rounded)
-            if not painter.isActive():
-                return pixmap
-                
-            painter.setRenderHint(QPainter.Antialiasing)
+            # Decoded JPEGs come out as RGB32, which shares its memory layout
+            # with opaque ARGB32_Premultiplied, so relabel instead of copying
+            if image.format() == QImage.Format_RGB32:
+                image.reinterpretAsFormat(QImage.Format_ARGB32_Premultiplied)
+            elif image.format() != QImage.Format_ARGB32_Premultiplied:
+                image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
             
-            # Create rounded rectangle path
-            from PyQt5.QtGui import QPainterPath
-            from PyQt5.QtCore import QRectF
-            path = QPainterPath()
-            rect = QRectF(rounded.rect())  # Convert QRect to QRectF
-            path.addRoundedRect(rect, radius, radius)
+            painter = QPainter(image)
+            if not painter.isActive():
+                return image
             
-            painter.setClipPath(path)
-            painter.drawPixmap(0, 0, pixmap)
+            # Keep only what lies inside the rounded rectangle; blending a
+            # cached mask avoids rasterising the path for every thumbnail
+            painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+            painter.drawImage(0, 0, _corner_mask(image.width(), image.height(), radius))
             
             # Ensure painter is properly ended
             if painter.isActive():
                 painter.end()
             
-            return rounded
+            return image
         except Exception as e:
-            # If rounded corners fail, return original pixmap
+            # If rounded corners fail, return original image
             print(f"Warning: Failed to add rounded corners: {e}")
-            return pixmap
+            return image
     
     def _get_cache_path(self, file_path: str, size: int) -> str:
-        """Get cache file path for thumbnail"""
-        # Create hash from file path and size
-        hash_input = f"{file_path}_{size}".encode('utf-8')
-        file_hash = hashlib.md5(hash_input).hexdigest()
+        """Get cache file path for thumbnail, or "" if the file can't be stat'ed
+        
+        The name covers the file's mtime and size as well as its path, so an
+        edited or replaced file maps to a new entry and a hit needs no check.
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return ""
+        hash_input = f"{file_path}_{st.st_mtime_ns}_{st.st_size}_{size}".encode('utf-8')
+        file_hash = hashlib.blake2b(hash_input, digest_size=12).hexdigest()
         return os.path.join(self.cache_dir, f"thumb_{file_hash}.png")
     
-    def _get_cached_thumbnail(self, file_path: str, size: int) -> Optional[QPixmap]:
-        """Get cached thumbnail if available and valid"""
-        if not self.config.is_cache_enabled():
+    def _get_cached_thumbnail(self, cache_path: str) -> Optional[QImage]:
+        """Get cached thumbnail if available (runs on the decode pool)"""
+        # A missing cache file just fails to load
+        image = QImage(cache_path)
+        if image.isNull():
             return None
-        
-        cache_path = self._get_cache_path(file_path, size)
-        
-        try:
-            if os.path.exists(cache_path):
-                # Check if cache is newer than original file
-                cache_mtime = os.path.getmtime(cache_path)
-                file_mtime = os.path.getmtime(file_path)
-                
-                if cache_mtime > file_mtime:
-                    pixmap = QPixmap(cache_path)
-                    if not pixmap.isNull():
-                        return pixmap
-        except Exception:
-            pass
-        
-        return None
+        return image
     
-    def _cache_thumbnail(self, file_path: str, thumbnail: QPixmap, size: int):
-        """Cache thumbnail to disk"""
-        try:
-            cache_path = self._get_cache_path(file_path, size)
-            thumbnail.save(cache_path, "PNG")
-        except Exception:
-            pass  # Ignore cache errors
+    def _cache_thumbnail(self, cache_path: str, thumbnail: QImage):
+        """Queue thumbnail to be cached to disk"""
+        self.write_queue.put((cache_path, thumbnail))
+    
+    def _write_cache_files(self):
+        """Write queued thumbnails to disk (runs on the cache writer thread)"""
+        while True:
+            cache_path, thumbnail = self.write_queue.get()
+            if cache_path is None:
+                self._clear_cache_files()
+                continue
+            # Write under a temporary name so a reader never sees half a
+            # file; quality 80 maps to zlib level 1, as cache files are
+            # disposable and encode speed matters more than size
+            temp_path = cache_path + '.tmp'
+            try:
+                if thumbnail.save(temp_path, "PNG", 80):
+                    os.replace(temp_path, cache_path)
+                    continue
+            except Exception:
+                pass  # Ignore cache errors
+            
+            # Cache cleanup only matches finished .png files, so don't leave
+            # a partial temporary file behind
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
     
     def clear_cache(self):
-        """Clear thumbnail cache"""
+        """Clear thumbnail cache in the background"""
+        # Queued behind pending writes, so no thumbnail lands after the clear
+        self.write_queue.put((None, None))
+    
+    def _clear_cache_files(self):
+        """Delete cached thumbnails (runs on the cache writer thread)"""
         try:
-            cache_dir = self.cache_dir
-            for filename in os.listdir(cache_dir):
-                if filename.startswith('thumb_') and filename.endswith('.png'):
-                    os.remove(os.path.join(cache_dir, filename))
-        except Exception:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('thumb_') and name.endswith('.png'):
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
             pass
     
     def get_cache_size(self) -> int:
         """Get cache size in bytes"""
         total_size = 0
         try:
-            cache_dir = self.cache_dir
-            for filename in os.listdir(cache_dir):
-                if filename.startswith('thumb_') and filename.endswith('.png'):
-                    file_path = os.path.join(cache_dir, filename)
-                    total_size += os.path.getsize(file_path)
-        except Exception:
+            # DirEntry.stat() reuses what the directory read already fetched
+            # on Windows, and entry.path saves a join per file
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (name.startswith('thumb_') and name.endswith('.png')
+                            and entry.is_file(follow_symlinks=False)):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
             pass
         return total_size
\ No newline at end of file
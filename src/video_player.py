@@ -17,6 +17,12 @@ from PyQt5.QtMultimediaWidgets import QVideoWidget
 from .photo_scanner import PhotoInfo
 
 
+def _fmt_ms(ms):
+    """Format milliseconds as MM:SS"""
+    minutes, seconds = divmod(max(ms, 0) // 1000, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
 class VideoPlayerWidget(QWidget):
     """Simple video player widget"""
     
@@ -28,6 +34,8 @@ class VideoPlayerWidget(QWidget):
         self.media_player = None
         self.video_widget = None
         self.current_video = None
+        self._total_time_str = "00:00"
+        self._last_time_text = "00:00 / 00:00"
         self.setup_ui()
         self.setup_media_player()
         
@@ -108,14 +116,14 @@ class VideoPlayerWidget(QWidget):
         
         # Time display
         self.time_label = QLabel("00:00 / 00:00")
-        self.time_label.setProperty("labelStyle", "caption")
+        self.time_label.setObjectName("captionLabel")
         button_layout.addWidget(self.time_label)
         
         button_layout.addStretch()
         
         # Volume control
         volume_label = QLabel("Volume:")
-        volume_label.setProperty("labelStyle", "caption")
+        volume_label.setObjectName("captionLabel")
         button_layout.addWidget(volume_label)
         
         self.volume_slider = QSlider(Qt.Horizontal)
@@ -223,6 +231,7 @@ class VideoPlayerWidget(QWidget):
     def on_duration_changed(self, duration):
         """Handle duration changes"""
         self.progress_slider.setRange(0, duration)
+        self._total_time_str = _fmt_ms(duration)
         self.update_time_display(self.media_player.position() if self.media_player else 0)
     
     def on_seek_start(self):
@@ -258,19 +267,11 @@ class VideoPlayerWidget(QWidget):
         if not self.media_player:
             return
         
-        duration = self.media_player.duration()
-        
-        # Format time
-        def format_time(ms):
-            seconds = ms // 1000
-            minutes = seconds // 60
-            seconds = seconds % 60
-            return f"{minutes:02d}:{seconds:02d}"
-        
-        current_time = format_time(position)
-        total_time = format_time(duration) if duration > 0 else "00:00"
-        
-        self.time_label.setText(f"{current_time} / {total_time}")
+        # Position ticks far more often than the displayed second changes
+        text = f"{_fmt_ms(position)} / {self._total_time_str}"
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self.time_label.setText(text)
     
     def show_error(self, message):
         """Show error message"""
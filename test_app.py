@@ -6,38 +6,43 @@
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QMessageBox
-from src.config import Config
-from src.main_window import MainWindow
 
 def test_with_sample_photos():
     """使用示例照片测试应用程序"""
     
+    # 先检查示例照片目录，目录不存在时无需加载 PyQt5 和主窗口模块
+    sample_path = os.path.abspath("sample_photos")
+    
+    if not os.path.isdir(sample_path):
+        print("示例照片目录不存在，请先运行 create_sample_photos.py")
+        return
+    
+    from PyQt5.QtWidgets import QApplication, QMessageBox
+    from PyQt5.QtCore import QTimer
+    from src.config import Config
+    from src.main_window import MainWindow
+    
     # 创建应用程序
     app = QApplication(sys.argv)
     
     # 创建配置并设置示例照片路径
     config = Config()
-    sample_path = os.path.abspath("sample_photos")
-    
-    if os.path.exists(sample_path):
-        config.set_photo_path(sample_path)
-        print(f"设置照片路径为: {sample_path}")
-    else:
-        print("示例照片目录不存在，请先运行 create_sample_photos.py")
-        return
+    config.set_photo_path(sample_path)
+    print(f"设置照片路径为: {sample_path}")
     
     # 创建主窗口
+    # 扫描之前还没有照片列表可供预热；缩略图在扫描出照片后由
+    # ThumbnailGenerator 在线程池中解码，并以 "thumb:尺寸:路径" 缓存在 QPixmapCache 中
     main_window = MainWindow(config)
     main_window.show()
     
-    # 显示消息
-    QMessageBox.information(main_window, "测试模式", 
-                          f"应用程序已启动，照片路径已设置为：\n{sample_path}\n\n"
-                          "点击工具栏中的'扫描照片'按钮开始测试。")
+    # 显示消息（进入事件循环后再弹出，以免模态对话框推迟启动工作）
+    message = (f"应用程序已启动，照片路径已设置为：\n{sample_path}\n\n"
+               "点击工具栏中的'扫描照片'按钮开始测试。")
+    QTimer.singleShot(0, lambda: QMessageBox.information(main_window, "测试模式", message))
     
     # 运行应用程序
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    test_with_sample_photos()
\ No newline at end of file
+    test_with_sample_photos()